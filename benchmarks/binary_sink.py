@@ -0,0 +1,102 @@
+"""
+Объем и стоимость записи бинарного лога против текстового.
+
+Запуск: `python -m benchmarks.binary_sink`.
+
+Текстовый логгер пишет две строки на вызов (старт и завершение), бинарный -
+одну запись (или две с `record_start=True`) с перечнем аргументов без текста
+сообщения. Сводки аргументов уникальны для каждого вызова, поэтому
+с `include_args=True` основной объем бинарного лога - таблица строк.
+"""
+
+import io
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from logging_decorator import BinarySink, LogConfig, log
+from logging_decorator.logging_decorator.binary_sink import HEADER, RECORD, read_records
+
+CALLS = 100_000
+CONFIGS = {
+    'с аргументами': LogConfig(),
+    'без аргументов': LogConfig(include_args=False),
+}
+
+
+def target(a: int, b: str) -> str:
+    return f'{a}-{b}'
+
+
+def text_bytes_per_call(config: LogConfig) -> float:
+    stream = io.StringIO()
+    logger = logging.getLogger('benchmarks.binary_sink')
+    logger.propagate = False
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    decorated = log(logger, config)(target)
+    for i in range(CALLS):
+        decorated(i, 'value')
+    logger.removeHandler(handler)
+    return len(stream.getvalue().encode()) / CALLS
+
+
+def binary_bytes_per_call(
+    directory: Path,
+    config: LogConfig,
+    *,
+    record_start: bool,
+) -> float:
+    path = directory / 'calls.bin'
+    sink = BinarySink(path, capacity=2 * CALLS, record_start=record_start)
+    decorated = log(sink, config)(target)
+    for i in range(CALLS):
+        decorated(i, 'value')
+    sink.close()
+    count = sum(1 for _ in read_records(path))
+    strings = path.with_name('calls.bin.strings').stat().st_size
+    path.unlink()
+    return (HEADER.size + count * RECORD.size + strings) / CALLS
+
+
+def binary_write_ns(directory: Path) -> float:
+    sink = BinarySink(directory / 'write.bin', capacity=CALLS)
+    extra = {
+        'func': 'target',
+        'elapsed': 0.001,
+        'status': 'success',
+        'signature': 'a: int = 1\n  b: str = value',
+    }
+    start = time.perf_counter_ns()
+    for _ in range(CALLS):
+        sink.info('', extra=extra)
+    elapsed = time.perf_counter_ns() - start
+    sink.close()
+    return elapsed / CALLS
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        for name, config in CONFIGS.items():
+            text = text_bytes_per_call(config)
+            print(f'{name}: текст {text:.1f} Б/вызов')
+            for record_start in (False, True):
+                binary = binary_bytes_per_call(
+                    Path(directory),
+                    config,
+                    record_start=record_start,
+                )
+                records = 'две записи' if record_start else 'одна запись'
+                print(
+                    f'  бинарный, {records}: {binary:.1f} Б/вызов '
+                    f'({text / binary:.1f}x меньше)',
+                )
+        write_ns = binary_write_ns(Path(directory))
+    print(f'Запись одной бинарной записи: {write_ns:.0f} нс')
+
+
+if __name__ == '__main__':
+    main()
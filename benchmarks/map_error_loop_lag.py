@@ -0,0 +1,103 @@
+"""
+Задержка event loop при шторме ошибок в функциях под `map_error`.
+
+Запуск: `python -m benchmarks.map_error_loop_lag`.
+
+Сравнивается форматирование контекста ошибки прямо в event loop
+(как было раньше) и `map_error`, который форматирует в потоке.
+"""
+
+import asyncio
+import statistics
+import time
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from exceptions_mapper import DetailedError, map_error
+from logging_decorator import LogConfig
+from logging_decorator.logging_decorator.services import get_signature_repr
+
+ERRORS = 200
+CONCURRENCY = 50
+TICK = 0.001
+
+
+@dataclass
+class Row:
+    """Строка ORM-подобной таблицы."""
+
+    id: int
+    name: str
+    payload: dict[str, str]
+
+
+ROWS = [Row(i, f'row-{i}', {str(k): 'x' * 50 for k in range(20)}) for i in range(100)]
+
+
+CONFIG = LogConfig(max_depth=3, show_complex_args=True)
+BATCH = {'a': ROWS, 'b': ROWS}
+
+
+async def failing(rows: list[Row], batch: dict[str, list[Row]]) -> None:
+    await asyncio.sleep(0)
+    msg = f'Не удалось обработать {len(rows)} строк из {len(batch)} пакетов'
+    raise ValueError(msg)
+
+
+mapped = map_error(config=CONFIG)(failing)
+
+
+async def render_on_loop() -> None:
+    try:
+        await failing(ROWS, BATCH)
+    except ValueError as e:
+        details = get_signature_repr(failing, (ROWS, BATCH), {}, CONFIG)
+        DetailedError(message=str(e), details=details).render()
+
+
+async def render_in_thread() -> None:
+    with suppress(DetailedError):
+        await mapped(ROWS, BATCH)
+
+
+async def _monitor(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def _storm(call: Callable[[], Awaitable[None]]) -> list[float]:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_monitor(lags, stop))
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+
+    async def _one() -> None:
+        async with semaphore:
+            await call()
+
+    await asyncio.gather(*(_one() for _ in range(ERRORS)))
+    stop.set()
+    await monitor
+    return lags
+
+
+def main() -> None:
+    for name, call in (
+        ('Форматирование в event loop', render_on_loop),
+        ('Форматирование в потоке', render_in_thread),
+    ):
+        start = time.perf_counter()
+        lags = asyncio.run(_storm(call))
+        elapsed = time.perf_counter() - start
+        print(
+            f'{name}: {ERRORS} ошибок за {elapsed:.2f} сек., '
+            f'задержка loop p50={statistics.median(lags) * 1000:.2f} мс, '
+            f'max={max(lags) * 1000:.2f} мс',
+        )
+
+
+if __name__ == '__main__':
+    main()
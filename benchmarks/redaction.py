@@ -0,0 +1,54 @@
+"""
+Стоимость скрытия `skipped_args` при форматировании широкой коллекции словарей.
+
+Запуск: `python -m benchmarks.redaction`.
+"""
+
+import time
+
+from logging_decorator import LogConfig
+from logging_decorator.logging_decorator.pretty_repr import pretty_repr_named
+
+KEYS = 10_000
+REPEATS = 5
+PATTERNS = (
+    'password',
+    'request.headers.authorization',
+    'request.*.cookie',
+    '*token*',
+    '*secret*',
+)
+
+
+def _wide(width: int) -> list[dict[str, object]]:
+    return [
+        {'id': i, 'access_token': 'x', 'name': f'row-{i}', 'secret_key': 'y', 'n': i}
+        for i in range(width)
+    ]
+
+
+def _measure(config: LogConfig, value: list[dict[str, object]]) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        pretty_repr_named('request', value, config)
+    return (time.perf_counter() - start) / REPEATS
+
+
+def main() -> None:
+    value = _wide(KEYS)
+    nodes = KEYS * 6
+    plain = _measure(LogConfig(max_arg_length=None, max_depth=3), value)
+    redacted = _measure(
+        LogConfig(max_arg_length=None, max_depth=3, skipped_args=PATTERNS),
+        value,
+    )
+    print(f'Без правил: {plain * 1000:.2f} мс ({plain / nodes * 1e9:.0f} нс/узел)')
+    print(
+        f'С правилами ({len(PATTERNS)}): {redacted * 1000:.2f} мс '
+        f'({redacted / nodes * 1e9:.0f} нс/узел, '
+        f'+{(redacted - plain) / nodes * 1e9:.0f} нс/узел)',
+    )
+
+
+if __name__ == '__main__':
+    main()
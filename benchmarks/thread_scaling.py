@@ -0,0 +1,102 @@
+"""
+Масштабирование декораторов по числу потоков (GIL и free-threaded сборки).
+
+Запуск: `python -m benchmarks.thread_scaling` (на free-threaded сборке -
+`python3.13t -m benchmarks.thread_scaling`).
+
+Каждый поток вызывает декорированную функцию `CALLS` раз, все потоки
+стартуют одновременно. Выводится число вызовов в секунду на один поток:
+без конкуренции за общее состояние оно не падает с ростом числа потоков
+на free-threaded сборке и делится на число потоков под GIL.
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import Callable
+
+from exceptions_mapper import DetailedError, map_error
+from logging_decorator import BinarySink, LogConfig, log
+
+THREADS = (1, 2, 4, 8, 16, 32, 64)
+CALLS = 1000
+CONFIG = LogConfig(skipped_args=['*token*'])
+PAYLOAD = {'id': 1, 'items': [1, 2, 3], 'api_token': 'secret'}
+
+
+def target(a: int, payload: dict[str, object]) -> int:
+    return a + len(payload)
+
+
+def failing(a: int, payload: dict[str, object]) -> None:
+    msg = f'Ошибка {a} {len(payload)}'
+    raise ValueError(msg)
+
+
+def _stdlib_logger() -> logging.Logger:
+    logger = logging.getLogger('benchmarks.thread_scaling')
+    logger.propagate = False
+    logger.addHandler(logging.StreamHandler(open(os.devnull, 'w', encoding='utf-8')))  # noqa: PTH123, SIM115
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+def _raising(func: Callable[[int, dict[str, object]], None]) -> Callable[[], None]:
+    def _call() -> None:
+        with suppress(DetailedError):
+            func(1, PAYLOAD)
+
+    return _call
+
+
+def _per_thread_rate(call: Callable[[], object], threads: int) -> float:
+    barrier = threading.Barrier(threads + 1)
+
+    def _worker() -> None:
+        barrier.wait()
+        for _ in range(CALLS):
+            call()
+
+    workers = [threading.Thread(target=_worker) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return CALLS / (time.perf_counter() - start)
+
+
+def _build() -> str:
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    if is_gil_enabled is None or is_gil_enabled():
+        return f'GIL, Python {sys.version.split()[0]}'
+    return f'free-threaded, Python {sys.version.split()[0]}'
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        sink = BinarySink(Path(directory) / 'calls.bin', capacity=10_000_000)
+        logged_binary = log(sink, CONFIG)(target)
+        logged_stdlib = log(_stdlib_logger(), CONFIG)(target)
+        mapped = map_error(config=CONFIG)(failing)
+        cases = {
+            'log -> BinarySink': lambda: logged_binary(1, PAYLOAD),
+            'log -> logging': lambda: logged_stdlib(1, PAYLOAD),
+            'map_error': _raising(mapped),
+        }
+        print(f'Сборка: {_build()}, вызовов на поток: {CALLS}')
+        print(f'{"потоков":>8} ' + ' '.join(f'{name:>18}' for name in cases))
+        for threads in THREADS:
+            rates = [_per_thread_rate(call, threads) for call in cases.values()]
+            print(f'{threads:>8} ' + ' '.join(f'{rate:>14.0f} в/с' for rate in rates))
+        sink.close()
+
+
+if __name__ == '__main__':
+    main()
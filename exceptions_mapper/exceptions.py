@@ -3,10 +3,10 @@ import pprint
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from types import FrameType
-from typing import Any, ClassVar
+from typing import Any, Callable, ClassVar, Iterable, Union
 
 from logging_decorator import LogConfig
-from logging_decorator.logging_decorator.pretty_repr import pretty_repr
+from logging_decorator.logging_decorator.pretty_repr import pretty_repr_named
 
 
 @dataclass(kw_only=True, repr=False)
@@ -21,6 +21,11 @@ class DetailedError(Exception):
     config: ClassVar[LogConfig] = field(default=LogConfig())
 
     _context: dict[str, Any] = field(default_factory=dict, init=False)
+    _snapshot: Union[tuple[list[str], dict[str, Any], LogConfig], None] = field(
+        default=None,
+        init=False,
+    )
+    _lazy_details: Union[Callable[[], str], None] = field(default=None, init=False)
 
     def __post_init__(self) -> None:
         """Пост-инициализация."""
@@ -28,14 +33,85 @@ class DetailedError(Exception):
         self._capture_context()
 
     def _capture_context(self) -> None:
-        """Автоматически собирает контекст выполнения."""
-        frame = _find_relevant_frame()
-        if not frame:
-            return
-        args = _get_args(frame, self.config)
-        exclude = {*self.config.skipped_args, *args.keys()}
-        config = LogConfig.from_config(self.config, skipped_args=exclude)
-        self._context.update({'locals': _get_locals(frame, config), 'args': args})
+        """
+        Запоминает контекст выполнения.
+
+        Здесь только дешевый снимок фрейма (имена аргументов и копия локальных
+        переменных), форматирование откладывается до `render`.
+        """
+        self.capture(_find_relevant_frame(), self.config)
+
+    def capture(
+        self,
+        frame: Union[FrameType, None],
+        config: LogConfig,
+    ) -> 'DetailedError':
+        """
+        Заменяет снимок контекста снимком фрейма `frame`.
+
+        Аргументы и локальные переменные будут отформатированы с правилами
+        `config` (в том числе `skipped_args`).
+        """
+        self._snapshot = (
+            (inspect.getargvalues(frame).args, dict(frame.f_locals), config)
+            if frame
+            else None
+        )
+        return self
+
+    def render(self) -> 'DetailedError':
+        """
+        Форматирует захваченный контекст и детали (однократно).
+
+        Не трогает traceback, поэтому может выполняться в другом потоке.
+        Объекты снимка при этом могут меняться параллельно, поэтому ошибка
+        форматирования не пробрасывается: детали заменяются текстом сообщения,
+        а в контекст добавляется `render_error`.
+        """
+        try:
+            self._render()
+        except Exception as exc:  # noqa: BLE001
+            self._snapshot = None
+            self._lazy_details = None
+            self._context.setdefault('render_error', repr(exc))
+            if 'details' not in self.__dict__:
+                self.details = self.message
+        return self
+
+    def _render(self) -> None:
+        if self._snapshot is not None:
+            arg_names, frame_locals, config = self._snapshot
+            self._snapshot = None
+            args = _get_args(arg_names, frame_locals, config)
+            self._context = {
+                'locals': _get_locals(frame_locals, config, exclude=arg_names),
+                'args': args,
+                **self._context,
+            }
+        self._resolve_details()
+
+    def with_lazy_details(self, factory: Callable[[], str]) -> 'DetailedError':
+        """
+        Откладывает вычисление деталей до `render` или первого чтения `details`.
+
+        До этого атрибут `details` не хранится, его значение вычисляет `__getattr__`.
+        """
+        self._lazy_details = factory
+        self.__dict__.pop('details', None)
+        return self
+
+    def _resolve_details(self) -> None:
+        factory = self.__dict__.get('_lazy_details')
+        if factory is not None:
+            self._lazy_details = None
+            self.details = factory()
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        """Вычисляет отложенные детали при первом обращении к `details`."""
+        if name == 'details' and self.__dict__.get('_lazy_details') is not None:
+            self.render()
+            return self.details
+        raise AttributeError(name)
 
     def with_context(self, **context: Any) -> 'DetailedError':  # noqa: ANN401
         """Добавляет контекст к исключению."""
@@ -44,6 +120,7 @@ class DetailedError(Exception):
 
     def to_dict(self) -> dict[str, Any]:
         """Сериализация ошибки."""
+        self.render()
         return {
             'type': self.__class__.__name__,
             'message': self.message,
@@ -56,7 +133,7 @@ class DetailedError(Exception):
     @property
     def _details(self) -> dict[str, Any] | str:
         return (
-            {k: pretty_repr(v, self.config) for k, v in self.details.items()}
+            _get_named(self.details.items(), self.config)
             if isinstance(self.details, dict)
             else self.details
         )
@@ -71,28 +148,45 @@ class DetailedError(Exception):
 
 
 def _get_args(
-    frame: FrameType,
+    arg_names: list[str],
+    frame_locals: dict[str, Any],
     config: LogConfig,
 ) -> dict[str, Any]:
     """Получает аргументы функции с форматированием."""
-    spec = inspect.getargvalues(frame)
-    return {
-        arg: pretty_repr(spec.locals[arg], config)
-        for arg in spec.args
-        if arg not in config.skipped_args
-    }
+    return _get_named(
+        ((arg, frame_locals[arg]) for arg in arg_names if arg in frame_locals),
+        config,
+    )
 
 
 def _get_locals(
-    frame: FrameType,
+    frame_locals: dict[str, Any],
     config: LogConfig,
+    exclude: Iterable[str] = (),
 ) -> dict[str, Any]:
     """Безопасно получает локальные переменные."""
-    return {
-        k: pretty_repr(v, config)
-        for k, v in frame.f_locals.items()
-        if not k.startswith('__') and k not in config.skipped_args
-    }
+    exclude = set(exclude)
+    return _get_named(
+        (
+            (k, v)
+            for k, v in frame_locals.items()
+            if not k.startswith('__') and k not in exclude
+        ),
+        config,
+    )
+
+
+def _get_named(
+    items: Iterable[tuple[str, Any]],
+    config: LogConfig,
+) -> dict[str, str]:
+    """Форматирует именованные значения, пропуская скрытые `skipped_args`."""
+    result = {}
+    for name, value in items:
+        value_repr = pretty_repr_named(name, value, config)
+        if value_repr is not None:
+            result[name] = value_repr
+    return result
 
 
 def _find_relevant_frame() -> FrameType:
@@ -1,11 +1,12 @@
-import sys
+import asyncio
 from contextvars import ContextVar
-from types import CodeType, FrameType, TracebackType
+from functools import partial
+from types import CodeType, FrameType, MappingProxyType, TracebackType
 from typing import (
     Any,
     Awaitable,
     Callable,
-    NoReturn,
+    Mapping,
     Optional,
     ParamSpec,
     Union,
@@ -18,7 +19,10 @@ from logging_decorator.logging_decorator.services import T, get_signature_repr,
 from logging_decorator.protocols import SyncOrAsyncFunc
 
 P = ParamSpec('P')
-request_context: ContextVar[dict[str, Any]] = ContextVar('request_context', default={})  # noqa: B039
+request_context: ContextVar[Mapping[str, Any]] = ContextVar(
+    'request_context',
+    default=MappingProxyType({}),
+)
 
 
 def map_error(  # noqa: C901
@@ -26,10 +30,17 @@ def map_error(  # noqa: C901
     *,
     config: LogConfig | None = None,
 ) -> SyncOrAsyncFunc:
-    """Декоратор для логирования работы функций."""
+    """
+    Декоратор для преобразования исключений функции в `DetailedError`.
+
+    В асинхронных функциях контекст ошибки (включая разворачивание сложных
+    объектов, `inspect.getmembers` и свойства) форматируется в рабочем потоке,
+    а не в потоке event loop: в это время loop может менять те же объекты.
+    Сбой форматирования не мешает пробросить `DetailedError`
+    (см. `DetailedError.render`).
+    """
     config = config or LogConfig()
     errors = errors or {Exception: DetailedError}
-    exclude_args = config.skipped_args or set()
 
     @overload
     def decorator(func: Callable[P, T]) -> Callable[P, T]: ...
@@ -40,44 +51,47 @@ def map_error(  # noqa: C901
     def decorator(  # type: ignore
         func: Union[Callable[P, T], Callable[P, Awaitable[T]]],
     ) -> Union[Callable[P, T], Callable[P, Awaitable[T]]]:
-        def _get_local_vars(frame: FrameType, exclude: set[str]) -> dict[str, Any]:
-            """Получает указанные локальные переменные из фрейма."""
-            return {
-                name: val for name, val in frame.f_locals.items() if name not in exclude
-            }
-
-        def _raise_error(
+        def _build_error(
             e: Exception,
             args: tuple[Any, ...],
             kwargs: dict[str, Any],
-        ) -> NoReturn:
-            if isinstance(e, DetailedError):
-                raise e
-            details = get_signature_repr(func, args, kwargs, config)
+        ) -> DetailedError:
+            """
+            Создает ошибку по дешевому снимку состояния.
+
+            Контекст ошибки - аргументы и локальные переменные фрейма `func`,
+            где возникло исключение, с правилами `config`. Форматирование
+            откладывается до `DetailedError.render`, traceback берется из
+            самого исключения.
+            """
             error_cls = errors.get(type(e), DetailedError)
-
-            context = request_context.get().copy()
-            _, _, exc_tb = sys.exc_info()
+            exc_tb = e.__traceback__
             frame = _get_error_frame(exc_tb, func.__code__) if exc_tb else None
-            context.update({'locals': _get_local_vars(frame, exclude_args)})  # type: ignore
-            error = error_cls(
-                message=str(e),
-                details=details,
+            error = (
+                error_cls(message=str(e))
+                .capture(frame, config)
+                .with_lazy_details(
+                    partial(get_signature_repr, func, args, kwargs, config),
+                )
             )
-            raise error.with_context(
-                **context,
+            return error.with_context(
+                **request_context.get(),
                 exception_type=type(e).__name__,
                 function_name=func.__name__,
-            ) from e
+            )
 
         if is_async(func):
 
             async def _map_error_async(*args: P.args, **kwargs: P.kwargs) -> T:
                 try:
                     result = await func(*args, **kwargs)
-                except Exception as e:  # noqa: BLE001
-                    # нельзя делать to_thread, т.к. не получится получить traceback exc
-                    _raise_error(e, args, kwargs)
+                except DetailedError:
+                    raise
+                except Exception as e:
+                    error = _build_error(e, args, kwargs)
+                    # снимок сделан в event loop, форматирование - в потоке
+                    await asyncio.to_thread(error.render)
+                    raise error from e
                 return result
 
             return _map_error_async
@@ -85,8 +99,10 @@ def map_error(  # noqa: C901
         def _map_error(*args: P.args, **kwargs: P.kwargs) -> T:
             try:
                 result = func(*args, **kwargs)
-            except Exception as e:  # noqa: BLE001
-                _raise_error(e, args, kwargs)
+            except DetailedError:
+                raise
+            except Exception as e:
+                raise _build_error(e, args, kwargs) from e
             return result  # type: ignore
 
         return _map_error
@@ -1,4 +1,15 @@
+from .logging_decorator.binary_sink import BinarySink
 from .logging_decorator.config import LogConfig
 from .logging_decorator.decorator import log
+from .logging_decorator.instrument import Instrumentation, instrument_module, log_class
+from .logging_decorator.registry import registry
 
-__all__ = ['log', 'LogConfig']
+__all__ = [
+    'BinarySink',
+    'Instrumentation',
+    'LogConfig',
+    'instrument_module',
+    'log',
+    'log_class',
+    'registry',
+]
@@ -1,2 +1,5 @@
+from .binary_sink import BinarySink  # noqa: F401
 from .config import LogConfig  # noqa: F401
 from .decorator import log  # noqa: F401
+from .instrument import Instrumentation, instrument_module, log_class  # noqa: F401
+from .registry import registry  # noqa: F401
@@ -0,0 +1,34 @@
+"""
+Декодер сегментов `BinarySink` в текст или JSON Lines.
+
+Запуск: `python -m logging_decorator.logging_decorator.binary_decode path ...`.
+Модуль вынесен из `binary_sink`, чтобы пакет его не импортировал
+и `runpy` не предупреждал о повторном импорте при запуске через `-m`.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Sequence, Union
+
+from .binary_sink import format_record, read_records
+
+
+def main(argv: Union[Sequence[str], None] = None) -> None:
+    """Декодирует сегменты бинарного лога в текст или JSON Lines."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument('paths', nargs='+', type=Path)
+    parser.add_argument('--format', choices=('text', 'json'), default='text')
+    options = parser.parse_args(argv)
+    for path in options.paths:
+        for record in read_records(path):
+            if options.format == 'json':
+                line = json.dumps(record, ensure_ascii=False)
+            else:
+                line = format_record(record)
+            sys.stdout.write(line + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,348 @@
+"""
+Компактный бинарный приемник записей декоратора `log`.
+
+Сегмент состоит из двух файлов:
+
+- `path` - отображенный в память файл с заголовком и записями фиксированного
+  размера (`RECORD`);
+- `path.strings` - таблица строк (имена функций и сводки аргументов),
+  каждая строка хранится один раз, запись ссылается на нее смещением.
+
+Чтение - `read_records`, консольный декодер - модуль `binary_decode`.
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+from datetime import datetime, timezone
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Iterator, Union
+
+MAGIC = b'LDBL'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIqq4x')
+RECORD = struct.Struct('<QqIIB')
+STRING = struct.Struct('<I')
+COUNT = struct.Struct('<I')
+COUNT_OFFSET = 8
+NO_VALUE = 0xFFFFFFFF
+NO_ELAPSED = -1
+SLOT_BLOCK = 64
+MAX_CACHED_TEXTS = 4096
+
+STATUSES = ('start', 'success', 'error', 'info')
+_STATUS_CODES = {name: code for code, name in enumerate(STATUSES)}
+_INFO = _STATUS_CODES['info']
+_ERROR = _STATUS_CODES['error']
+
+
+class BinarySink:
+    """
+    Логгер, пишущий записи фиксированного формата в mmap-файл с ротацией.
+
+    Соответствует протоколу `Logger` и берет данные из `extra`,
+    который передает декоратор `log`. Текст сообщения не сохраняется.
+    По умолчанию пишется одна запись на вызов (успех или ошибка, со сводкой
+    аргументов), записи о старте включаются `record_start=True`.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike[str]],
+        *,
+        capacity: int = 1_000_000,
+        backup_count: int = 5,
+        record_start: bool = False,
+    ) -> None:
+        """Открывает новый сегмент, сдвигая существующие в резервные копии."""
+        self.path = Path(path)
+        self.capacity = capacity
+        self.backup_count = backup_count
+        self.record_start = record_start
+        self._lock = threading.Lock()
+        self._closed = False
+        self._cursors: dict[int, list[Any]] = {}
+        self._segment = self._open()
+
+    def info(self, msg: str, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401, ARG002
+        """Запись о старте/завершении функции."""
+        extra = kwargs.get('extra')
+        if extra is None:
+            self._write(_INFO, '', msg, None)
+            return
+        status = extra.get('status')
+        if status == 'start' and not self.record_start:
+            return
+        self._write(
+            _STATUS_CODES.get(status, _INFO),
+            extra.get('func', ''),
+            extra.get('signature'),
+            extra.get('elapsed'),
+        )
+
+    def exception(self, msg: str, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401, ARG002
+        """Запись об ошибке функции."""
+        extra = kwargs.get('extra') or {}
+        text = extra.get('exception', msg)
+        if extra.get('signature'):
+            text = f'{text}\n{extra["signature"]}'
+        self._write(_ERROR, extra.get('func', ''), text, None)
+
+    def flush(self) -> None:
+        """Сбрасывает данные сегмента на диск."""
+        with self._lock:
+            self._segment.flush(closing=False)
+
+    def close(self) -> None:
+        """Закрывает текущий сегмент, последующие записи игнорируются."""
+        with self._lock:
+            self._closed = True
+            self._segment.flush(closing=True)
+            self._segment.view.release()
+            self._segment.mmap.close()
+
+    def _write(
+        self,
+        status: int,
+        func: str,
+        text: Union[str, None],
+        elapsed: Union[float, None],
+    ) -> None:
+        if self._closed:
+            return
+        timestamp = time.monotonic_ns()
+        while True:
+            cursor = self._cursors.get(threading.get_ident())
+            if cursor is None or cursor[1] >= cursor[2] or cursor[0] is not self._segment:
+                cursor = self._reserve()
+                if cursor is None:
+                    return
+            segment, slot, _ = cursor
+            cursor[1] = slot + 1
+            func_id = segment.names.get(func) or self._intern(segment, func)
+            text_id = (
+                segment.texts.get(text) or self._intern(segment, text, is_name=False)
+                if text
+                else NO_VALUE
+            )
+            if func_id is not None and text_id is not None:
+                break
+            # другой поток закрыл сегмент ротацией до добавления строк:
+            # слот остается пустым, запись уходит в новый сегмент
+        try:
+            RECORD.pack_into(
+                segment.view,
+                HEADER.size + slot * RECORD.size,
+                timestamp,
+                NO_ELAPSED if elapsed is None else int(elapsed * 1e9),
+                func_id,
+                text_id,
+                status,
+            )
+        except (TypeError, ValueError):
+            # приемник закрыли между проверкой и записью; как и обработчики
+            # logging, ошибки приемника в вызывающий код не пробрасываем
+            if not self._closed:
+                raise
+
+    def _reserve(self) -> Union[list[Any], None]:
+        """
+        Выдает потоку новый блок слотов, при заполнении сегмента - ротация.
+
+        Курсор потока - список `[segment, position, end]`: блок `[position, end)`
+        в `segment`. Курсоры хранятся в словаре по идентификатору потока,
+        а не в `threading.local`: чтение из словаря на горячем пути дешевле
+        обращений к атрибутам локального объекта.
+        """
+        with self._lock:
+            if self._closed:
+                return None
+            segment = self._segment
+            if segment.reserved >= self.capacity:
+                segment.flush(closing=True)
+                segment = self._segment = self._open()
+            slot = segment.reserved
+            segment.reserved = min(slot + SLOT_BLOCK, self.capacity)
+            cursor = self._cursors[threading.get_ident()] = [
+                segment,
+                slot,
+                segment.reserved,
+            ]
+            return cursor
+
+    def _intern(
+        self,
+        segment: '_Segment',
+        text: str,
+        *,
+        is_name: bool = True,
+    ) -> Union[int, None]:
+        with self._lock:
+            return segment.intern(text, is_name=is_name)
+
+    def _open(self) -> '_Segment':
+        self._rotate_files()
+        return _Segment(self.path, self.capacity)
+
+    def _rotate_files(self) -> None:
+        if not self.path.exists():
+            return
+        for i in range(self.backup_count - 1, 0, -1):
+            _move_segment(_backup_path(self.path, i), _backup_path(self.path, i + 1))
+        if self.backup_count:
+            _move_segment(self.path, _backup_path(self.path, 1))
+
+
+class _Segment:
+    """
+    Открытый сегмент лога.
+
+    Потоки резервируют слоты блоками по `SLOT_BLOCK` и пишут в свой блок
+    без блокировок и общих счетчиков; под блокировкой только выдача блока,
+    добавление новых строк и ротация. Неиспользованные слоты блока остаются
+    пустыми записями, которые декодер пропускает. Смещение 0 в таблице строк
+    занято пустой строкой, чтобы `names.get(...) or ...` не путал его
+    с промахом.
+
+    Имена функций (`names`) запоминаются все. Сводки аргументов обычно
+    уникальны для каждого вызова, поэтому `texts` помнит не больше
+    `MAX_CACHED_TEXTS` последних: этого хватает, чтобы записи о старте
+    и завершении одного вызова ссылались на одну строку, а память
+    не росла до ротации.
+    """
+
+    def __init__(self, path: Path, capacity: int) -> None:
+        size = HEADER.size + capacity * RECORD.size
+        with path.open('wb') as f:
+            f.truncate(size)
+        self.capacity = capacity
+        self.file = path.open('r+b')
+        self.mmap = mmap.mmap(self.file.fileno(), size)
+        # запись через memoryview заметно дешевле, чем напрямую в mmap
+        self.view = memoryview(self.mmap)
+        HEADER.pack_into(
+            self.mmap,
+            0,
+            MAGIC,
+            VERSION,
+            RECORD.size,
+            0,
+            time.time_ns(),
+            time.monotonic_ns(),
+        )
+        self.reserved = 0
+        self.strings = _strings_path(path).open('wb')
+        self.strings_size = 0
+        self.names: dict[str, int] = {}
+        self.texts: dict[str, int] = {}
+        self.closed = False
+        self.intern('')
+
+    def intern(self, text: str, *, is_name: bool = True) -> Union[int, None]:
+        """Смещение строки в таблице; None, если сегмент уже закрыт."""
+        interned = self.names if is_name else self.texts
+        offset = interned.get(text)
+        if offset is not None:
+            return offset
+        if self.closed:
+            return None
+        data = text.encode()
+        offset = self.strings_size
+        self.strings.write(STRING.pack(len(data)) + data)
+        self.strings_size += STRING.size + len(data)
+        if not is_name and len(interned) >= MAX_CACHED_TEXTS:
+            interned.clear()
+        interned[text] = offset
+        return offset
+
+    def flush(self, *, closing: bool) -> None:
+        if self.closed:
+            return
+        COUNT.pack_into(self.mmap, COUNT_OFFSET, self.reserved)
+        self.strings.flush()
+        self.mmap.flush()
+        if closing:
+            # mmap не закрывается: в него еще могут дописывать потоки,
+            # получившие слот до ротации
+            self.closed = True
+            self.strings.close()
+            self.file.close()
+
+
+def read_records(path: Union[str, os.PathLike[str]]) -> Iterator[dict[str, Any]]:
+    """Читает записи сегмента."""
+    path = Path(path)
+    data = path.read_bytes()
+    strings = _strings_path(path).read_bytes()
+    magic, version, record_size, count, wall_base, mono_base = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+        msg = f'Файл "{path}" не является сегментом бинарного лога.'
+        raise ValueError(msg)
+    clock_offset = wall_base - mono_base
+    if not count:
+        # сегмент не был сброшен: читаем все слоты
+        count = (len(data) - HEADER.size) // RECORD.size
+
+    # блоки слотов разных потоков перемежаются - восстанавливаем порядок времени
+    rows = sorted(
+        (
+            row
+            for row in RECORD.iter_unpack(
+                data[HEADER.size : HEADER.size + count * RECORD.size],
+            )
+            if row[0]
+        ),
+        key=itemgetter(0),
+    )
+    for timestamp, elapsed, func_id, text_id, status in rows:
+        yield {
+            'timestamp': (timestamp + clock_offset) / 1e9,
+            'func': _read_string(strings, func_id),
+            'status': STATUSES[status] if status < len(STATUSES) else 'info',
+            'elapsed': None if elapsed == NO_ELAPSED else elapsed / 1e9,
+            'text': _read_string(strings, text_id),
+        }
+
+
+def format_record(record: dict[str, Any]) -> str:
+    """Текстовое представление записи."""
+    moment = datetime.fromtimestamp(record['timestamp'], tz=timezone.utc)
+    line = f'{moment:%Y-%m-%dT%H:%M:%S.%f} {record["status"]} {record["func"] or "?"}'
+    if record['elapsed'] is not None:
+        line += f' {record["elapsed"]:.6f} сек.'
+    if record['text']:
+        line += f' {record["text"].strip()}'
+    return line
+
+
+def _read_string(strings: bytes, offset: int) -> Union[str, None]:
+    """
+    Строка по смещению; None, если ее нет в таблице.
+
+    Таблица строк пишется через буфер, поэтому после аварийного завершения
+    записи в mmap могут ссылаться на строки, не дошедшие до диска.
+    """
+    if offset == NO_VALUE or offset + STRING.size > len(strings):
+        return None
+    (length,) = STRING.unpack_from(strings, offset)
+    start = offset + STRING.size
+    if start + length > len(strings):
+        return None
+    return strings[start : start + length].decode(errors='replace')
+
+
+def _strings_path(path: Path) -> Path:
+    return path.with_name(f'{path.name}.strings')
+
+
+def _backup_path(path: Path, index: int) -> Path:
+    return path.with_name(f'{path.name}.{index}')
+
+
+def _move_segment(source: Path, target: Path) -> None:
+    for src, dst in ((source, target), (_strings_path(source), _strings_path(target))):
+        if src.exists():
+            src.replace(dst)
@@ -1,6 +1,8 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Iterable, Union
 
+from .redaction import Redactor
+
 
 @dataclass(frozen=True)
 class LogConfig:
@@ -9,9 +11,30 @@ class LogConfig:
     include_args: bool = True
     max_arg_length: Union[int, None] = 100
     show_types: bool = True
-    skipped_args: Iterable[str] = field(default_factory=list)
+    skipped_args: Iterable[str] = field(default_factory=frozenset)
     max_depth: int = 1
     show_complex_args: bool = False
+    measure_cpu_time: bool = False
+    measure_memory: bool = False
+    measure_gc: bool = False
+    measure_await: bool = False
+    redactor: Redactor = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Компилирует `skipped_args` в `redactor`."""
+        skipped_args = frozenset(self.skipped_args)
+        object.__setattr__(self, 'skipped_args', skipped_args)
+        object.__setattr__(self, 'redactor', Redactor(skipped_args))
+
+    @property
+    def measure_resources(self) -> bool:
+        """Включена ли хотя бы одна метрика ресурсов."""
+        return (
+            self.measure_cpu_time
+            or self.measure_memory
+            or self.measure_gc
+            or self.measure_await
+        )
 
     @classmethod
     def from_config(
@@ -20,4 +43,5 @@ class LogConfig:
         **kwargs: bool | int | None | str | Iterable[str],
     ) -> 'LogConfig':
         """Создание конфигурации логирования."""
-        return cls(**{**config.__dict__, **kwargs})
+        current = {f.name: getattr(config, f.name) for f in fields(config) if f.init}
+        return cls(**{**current, **kwargs})
@@ -1,4 +1,5 @@
 import asyncio
+import inspect
 import time
 from functools import wraps
 from typing import (
@@ -12,12 +13,14 @@ from typing import (
 from logging_decorator.protocols import Logger, SyncOrAsyncFunc
 
 from .config import LogConfig
+from .registry import Switch, registry
+from .resources import ResourceMeter, ResourceUsage
 from .services import P, T, get_signature_repr, is_async
 
 LoggerType = TypeVar('LoggerType', bound='Logger')
 
 
-def log(  # type: ignore # noqa: C901
+def log(  # type: ignore
     logger: Logger,
     config: Union[LogConfig, None] = None,
 ) -> SyncOrAsyncFunc:
@@ -30,80 +33,153 @@ def log(  # type: ignore # noqa: C901
     @overload
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]: ...
 
-    def decorator(  # type: ignore # noqa: C901
+    def decorator(  # type: ignore
         func: Union[Callable[P, T], Callable[P, Awaitable[T]]],
     ) -> Union[Callable[P, T], Callable[P, Awaitable[T]]]:
-        def _log_start_work(*args: P.args, **kwargs: P.kwargs) -> float:
-            start = time.perf_counter()
-            signature_repr = get_signature_repr(func, args, kwargs, config)
-            signature = ''
-            if config.include_args and signature_repr:
-                signature = f' с аргументами:\n  {signature_repr}'
-            msg = f'Функция "{func.__name__}" начала работу{signature}.'
-            logger.info(
-                msg,
-                extra={
-                    'func': func.__name__,
-                    'arguments': signature,
-                    'status': 'start',
-                },
-            )
-            return start
-
-        def _log_exception(exc: Exception) -> None:
-            exc_repr = repr(exc)
-            msg = f'Ошибка в функции "{func.__name__}":\n{exc_repr}.'
-            logger.exception(  # noqa: LOG004
-                msg,
-                extra={
-                    'func': func.__name__,
-                    'exception': exc_repr,
-                    'status': 'error',
-                },
-            )
-
-        def _log_finish_work(start_time: float) -> None:
-            elapsed = time.perf_counter() - start_time
-            msg = f'Функция "{func.__name__}" завершила работу за {elapsed:.4f} сек.'
-            logger.info(
-                msg,
-                extra={
-                    'func': func.__name__,
-                    'elapsed': elapsed,
-                    'status': 'success',
-                },
-            )
+        return wrap(func, logger, config)
 
-        if is_async(func):
+    return decorator  # type: ignore
 
-            @wraps(func)
-            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-                """Обертка для асинхронных функций."""
-                start_time = await asyncio.to_thread(_log_start_work, *args, **kwargs)
-                try:
-                    result = await func(*args, **kwargs)
-                except Exception as exc:
-                    await asyncio.to_thread(_log_exception, exc)
-                    raise
-                else:
-                    await asyncio.to_thread(_log_finish_work, start_time)
-                    return result
 
-            return async_wrapper
+def wrap(  # noqa: C901, PLR0915
+    func: Union[Callable[P, T], Callable[P, Awaitable[T]]],
+    logger: Logger,
+    config: LogConfig,
+    switch: Union[Switch, None] = None,
+) -> Union[Callable[P, T], Callable[P, Awaitable[T]]]:
+    """
+    Оборачивает функцию логированием и регистрирует ее в `registry`.
+
+    Обертка хранит запись реестра в атрибуте `__log_entry__`.
+    В `extra` всех записей передается `signature` - аргументы без текста
+    сообщения (для структурных приемников вроде `BinarySink`).
+    Сигнатура функции вычисляется один раз при оборачивании.
+    Конфигурация читается из снимка записи реестра на каждом вызове,
+    поэтому ее можно менять в рантайме без переоборачивания.
+    """
+    entry = registry.register(func, config, switch)
+    name = getattr(func, '__name__', None) or type(func).__name__
+    try:
+        signature = inspect.signature(func)
+    except (TypeError, ValueError):
+        signature = None
+
+    def _log_start_work(
+        config: LogConfig,
+        args: tuple[object, ...],
+        kwargs: dict[str, object],
+    ) -> tuple[float, str]:
+        start = time.perf_counter()
+        signature_repr = get_signature_repr(func, args, kwargs, config, signature)
+        signature_msg = ''
+        if config.include_args and signature_repr:
+            signature_msg = f' с аргументами:\n  {signature_repr}'
+        msg = f'Функция "{name}" начала работу{signature_msg}.'
+        logger.info(
+            msg,
+            extra={
+                'func': name,
+                'arguments': signature_msg,
+                'signature': signature_repr,
+                'status': 'start',
+            },
+        )
+        return start, signature_repr
+
+    def _log_exception(exc: Exception, signature_repr: str) -> None:
+        exc_repr = repr(exc)
+        msg = f'Ошибка в функции "{name}":\n{exc_repr}.'
+        logger.exception(  # noqa: LOG004
+            msg,
+            extra={
+                'func': name,
+                'exception': exc_repr,
+                'signature': signature_repr,
+                'status': 'error',
+            },
+        )
+
+    def _log_finish_work(
+        start_time: float,
+        signature_repr: str,
+        usage: Union[ResourceUsage, None] = None,
+    ) -> None:
+        elapsed = time.perf_counter() - start_time
+        extra: dict[str, object] = {
+            'func': name,
+            'elapsed': elapsed,
+            'signature': signature_repr,
+            'status': 'success',
+        }
+        resources = ''
+        if usage is not None:
+            extra['resources'] = usage.as_dict()
+            if extra['resources']:
+                resources = f' ({usage})'
+        msg = f'Функция "{name}" завершила работу за {elapsed:.4f} сек.{resources}'
+        logger.info(msg, extra=extra)
+
+    if is_async(func):
 
         @wraps(func)
-        def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            """Обертка для синхронных функций."""
-            start_time = _log_start_work(*args, **kwargs)
+        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            """Обертка для асинхронных функций."""
+            snapshot = entry.snapshot
+            if not snapshot.enabled:
+                return await func(*args, **kwargs)
+            start_time, signature_repr = await asyncio.to_thread(
+                _log_start_work,
+                snapshot.config,
+                args,
+                kwargs,
+            )
+            meter = None
+            if snapshot.config.measure_resources:
+                meter = ResourceMeter(snapshot.config, is_async=True)
             try:
-                result = func(*args, **kwargs)
+                if meter is None:
+                    result = await func(*args, **kwargs)
+                else:
+                    result = await meter.measure(func(*args, **kwargs))
             except Exception as exc:
-                _log_exception(exc)
+                if meter is not None:
+                    meter.stop()
+                await asyncio.to_thread(_log_exception, exc, signature_repr)
                 raise
             else:
-                _log_finish_work(start_time)
-                return result  # type: ignore
-
-        return sync_wrapper
-
-    return decorator  # type: ignore
+                usage = meter.stop() if meter is not None else None
+                await asyncio.to_thread(
+                    _log_finish_work,
+                    start_time,
+                    signature_repr,
+                    usage,
+                )
+                return result
+
+        async_wrapper.__log_entry__ = entry  # type: ignore
+        return async_wrapper
+
+    @wraps(func)
+    def sync_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        """Обертка для синхронных функций."""
+        snapshot = entry.snapshot
+        if not snapshot.enabled:
+            return func(*args, **kwargs)  # type: ignore
+        start_time, signature_repr = _log_start_work(snapshot.config, args, kwargs)
+        meter = None
+        if snapshot.config.measure_resources:
+            meter = ResourceMeter(snapshot.config)
+        try:
+            result = func(*args, **kwargs)
+        except Exception as exc:
+            if meter is not None:
+                meter.stop()
+            _log_exception(exc, signature_repr)
+            raise
+        else:
+            usage = meter.stop() if meter is not None else None
+            _log_finish_work(start_time, signature_repr, usage)
+            return result  # type: ignore
+
+    sync_wrapper.__log_entry__ = entry  # type: ignore
+    return sync_wrapper
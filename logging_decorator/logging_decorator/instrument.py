@@ -0,0 +1,165 @@
+import inspect
+from fnmatch import fnmatchcase
+from types import ModuleType
+from typing import Any, Callable, Iterable, TypeVar, Union
+
+from logging_decorator.protocols import Logger
+
+from .config import LogConfig
+from .decorator import wrap
+from .registry import Switch
+
+C = TypeVar('C', bound=type)
+
+
+class Instrumentation(Switch):
+    """Группа функций, обернутых логированием за один проход."""
+
+    __slots__ = ('wrapped',)
+
+    def __init__(self) -> None:
+        """Создает включенную пустую группу."""
+        super().__init__()
+        self.wrapped: list[str] = []
+
+    def enable(self) -> None:
+        """Включает логирование всех функций группы."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Выключает логирование всех функций группы без переоборачивания."""
+        self.enabled = False
+
+
+def log_class(
+    logger: Logger,
+    config: Union[LogConfig, None] = None,
+    *,
+    include: Iterable[str] = ('*',),
+    exclude: Iterable[str] = (),
+    properties: bool = False,
+) -> Callable[[C], C]:
+    """
+    Декоратор класса для логирования всех публичных методов.
+
+    Шаблоны `include`/`exclude` сравниваются с именем метода (`fnmatch`).
+    Переключатель группы доступен через атрибут класса `__instrumentation__`.
+    Уже обернутые классы и методы (в том числе через `log`) не оборачиваются повторно.
+    """
+    config = config or LogConfig()
+    include, exclude = tuple(include), tuple(exclude)
+
+    def decorator(cls: C) -> C:
+        if '__instrumentation__' in vars(cls):
+            return cls
+        instrumentation = Instrumentation()
+        _instrument_class(
+            cls,
+            logger,
+            config,
+            instrumentation,
+            include=include,
+            exclude=exclude,
+            properties=properties,
+        )
+        cls.__instrumentation__ = instrumentation  # type: ignore
+        return cls
+
+    return decorator
+
+
+def instrument_module(  # noqa: PLR0913
+    module: ModuleType,
+    logger: Logger,
+    config: Union[LogConfig, None] = None,
+    *,
+    include: Iterable[str] = ('*',),
+    exclude: Iterable[str] = (),
+    classes: bool = True,
+    properties: bool = False,
+) -> Instrumentation:
+    """
+    Оборачивает логированием публичные функции модуля (и методы его классов).
+
+    Учитываются только объекты, объявленные в самом модуле.
+    Шаблоны сравниваются с именем функции или с `Класс.метод`.
+    Уже обернутые функции (`__log_entry__`) и классы (`__instrumentation__`)
+    пропускаются, поэтому повторный вызов ничего не оборачивает заново.
+    """
+    config = config or LogConfig()
+    include, exclude = tuple(include), tuple(exclude)
+    instrumentation = Instrumentation()
+    for name, obj in list(vars(module).items()):
+        if name.startswith('_') or getattr(obj, '__module__', None) != module.__name__:
+            continue
+        if inspect.isfunction(obj):
+            if _is_matched(name, include, exclude) and not _is_logged(obj):
+                setattr(module, name, wrap(obj, logger, config, instrumentation))
+                instrumentation.wrapped.append(name)
+        elif classes and inspect.isclass(obj) and '__instrumentation__' not in vars(obj):
+            obj.__instrumentation__ = instrumentation  # type: ignore
+            _instrument_class(
+                obj,
+                logger,
+                config,
+                instrumentation,
+                include=include,
+                exclude=exclude,
+                properties=properties,
+                prefix=f'{name}.',
+            )
+    return instrumentation
+
+
+def _instrument_class(  # noqa: PLR0913
+    cls: type,
+    logger: Logger,
+    config: LogConfig,
+    instrumentation: Instrumentation,
+    *,
+    include: tuple[str, ...],
+    exclude: tuple[str, ...],
+    properties: bool,
+    prefix: str = '',
+) -> None:
+    """Оборачивает публичные методы класса на месте."""
+
+    def _wrap(func: Callable[..., Any]) -> Callable[..., Any]:
+        return wrap(func, logger, config, instrumentation)
+
+    for name, attr in list(vars(cls).items()):
+        if name.startswith('_') or not _is_matched(prefix + name, include, exclude):
+            continue
+        if _is_logged(getattr(attr, '__func__', None) or getattr(attr, 'fget', attr)):
+            continue
+        if isinstance(attr, staticmethod):
+            wrapped: Any = staticmethod(_wrap(attr.__func__))
+        elif isinstance(attr, classmethod):
+            wrapped = classmethod(_wrap(attr.__func__))
+        elif isinstance(attr, property):
+            if not properties:
+                continue
+            wrapped = property(
+                attr.fget and _wrap(attr.fget),
+                attr.fset and _wrap(attr.fset),
+                attr.fdel and _wrap(attr.fdel),
+                attr.__doc__,
+            )
+        elif inspect.isfunction(attr):
+            wrapped = _wrap(attr)
+        else:
+            continue
+        setattr(cls, name, wrapped)
+        instrumentation.wrapped.append(prefix + name)
+
+
+def _is_matched(name: str, include: tuple[str, ...], exclude: tuple[str, ...]) -> bool:
+    """Проверяет имя по шаблонам включения и исключения."""
+    return any(fnmatchcase(name, p) for p in include) and not any(
+        fnmatchcase(name, p) for p in exclude
+    )
+
+
+def _is_logged(func: object) -> bool:
+    """Обернута ли функция декоратором `log` (напрямую или через инструментацию)."""
+    return hasattr(func, '__log_entry__')
@@ -1,70 +1,51 @@
 import inspect
+import threading
+from abc import get_cache_token
 from contextlib import suppress
 from datetime import datetime
-from functools import singledispatch
-from typing import Any, Union
+from functools import partial, singledispatch
+from itertools import islice
+from types import FunctionType, MethodType, NoneType, UnionType
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Literal,
+    Union,
+    get_args,
+    get_origin,
+)
+from weakref import WeakSet, finalize
 
 from logging_decorator.logging_decorator.config import LogConfig
+from logging_decorator.logging_decorator.redaction import REDACT, REDACTED, Rules
+
+_MAX_ITEMS = 5
 
 
 @singledispatch
-def pretty_repr(obj: Any, config: LogConfig, depth: int = 0) -> str:  # noqa: ANN401, C901
-    """Рекурсивное форматирование объектов."""
-
-    def _get_function_repr() -> str:
-        sig = inspect.signature(obj)
-        params = []
-        return_annotation = _format_annotation(sig.return_annotation)
-        for param in sig.parameters.values():
-            param_str = param.name
-            param_str += f': {_format_annotation(param.annotation)}'
-            if param.default != inspect.Parameter.empty:
-                default_repr = pretty_repr(param.default, config, depth + 1)
-                param_str += f' = {default_repr}'
-            if param.kind == inspect.Parameter.VAR_POSITIONAL:
-                param_str = f'*{param_str}'
-            elif param.kind == inspect.Parameter.VAR_KEYWORD:
-                param_str = f'**{param_str}'
-            params.append(param_str)
-        name = getattr(obj, '__name__', None)
-        if name is None:
-            name = obj.__class__.__name__
-        return f'{name}({", ".join(params)}) -> {return_annotation}'
-
-    def _get_repr_with_getmembers() -> str:
-        attrs = {
-            k: pretty_repr(v, config, depth + 1)
-            for k, v in inspect.getmembers(obj)
-            if not k.startswith('_') and not inspect.ismethod(v)
-        }
-        return f'{obj.__class__.__name__}({attrs})'
-
-    def _get_repr_with_dict() -> str:
-        try:
-            attrs = {
-                k: pretty_repr(v, config, depth + 1)
-                for k, v in obj.__dict__.items()
-                if not k.startswith('_')
-            }
-        except Exception:  # noqa: BLE001
-            return f'{obj.__class__.__name__} instance'
-        else:
-            return f'{obj.__class__.__name__}({attrs})'
+def pretty_repr(obj: Any, config: LogConfig, depth: int = 0) -> str:  # noqa: ANN401
+    """
+    Форматирование объектов.
+
+    Вложенные контейнеры и объекты обходятся без рекурсии (`_Renderer`),
+    циклические ссылки выводятся как `<cycle Foo@0x...>`, а повторно
+    встреченный в рамках одного вызова объект - как `<ref Foo@0x...>`.
+    """
+    return _Renderer(config).render(obj, depth)
 
-    if inspect.isfunction(obj):
-        with suppress(Exception):
-            return _get_function_repr()
-    else:
-        if depth > config.max_depth:
-            return '...'
-        if not config.show_complex_args:
-            if isinstance(obj, (Exception, datetime)):
-                return repr(obj)
-            return f'<{obj.__class__.__name__}>'
-    try:
-        return _get_repr_with_getmembers()
-    except Exception:  # noqa: BLE001
-        return _get_repr_with_dict()
+
+def pretty_repr_named(name: str, obj: Any, config: LogConfig) -> Union[str, None]:  # noqa: ANN401
+    """
+    Форматирование именованного значения (аргумента, локальной переменной).
+
+    Учитывает вложенные правила `skipped_args` для этого имени.
+    Возвращает None, если значение скрыто целиком.
+    """
+    rules = config.redactor.root(name) if config.redactor.active else None
+    if rules is REDACT:
+        return None
+    return _Renderer(config).render(obj, 0, rules)
 
 
 @pretty_repr.register(int)
@@ -89,30 +70,414 @@ def _(obj: str, config: LogConfig, depth: int = 0) -> str:
 @pretty_repr.register(list)
 @pretty_repr.register(tuple)
 @pretty_repr.register(set)
-def _(obj: Union[list, tuple, set], config: LogConfig, depth: int = 0) -> str:
-    items = [pretty_repr(x, config, depth + 1) for x in obj]
-    if config.max_arg_length and len(items) > 5:
-        items = items[:5] + ['...']
-    return f'{type(obj).__name__}({", ".join(items)})'
+@pretty_repr.register(dict)
+def _render_container(
+    obj: Union[list, tuple, set, dict],
+    config: LogConfig,
+    depth: int = 0,
+) -> str:
+    return _Renderer(config).render(obj, depth)
 
 
-@pretty_repr.register(dict)
-def _(obj: dict, config: LogConfig, depth: int = 0) -> str:
-    items = [
-        f'{k}: {pretty_repr(v, config, depth + 1)}' for k, v in list(obj.items())[:5]
-    ]
-    if config.max_arg_length and len(obj) > 5:
-        items.append('...')
-    return f'dict({", ".join(items)})'
+_EXPANDED = frozenset({pretty_repr.registry[object], _render_container})
+_CALLABLES = (FunctionType, MethodType, partial)
+_DISPATCH_CACHE_SIZE = 1024
+_MAX_REPEATED_LENGTH = 200
 
 
-def _format_annotation(annotation: str) -> str:
+class _DispatchCache(threading.local):
+    """
+    Кэш `pretty_repr.dispatch` текущего потока.
+
+    Общий кэш `singledispatch` - словарь со слабыми ключами: каждое чтение
+    создает слабую ссылку на тип, и без GIL потоки конкурируют за блокировку
+    списка ссылок одного и того же типа. Здесь каждый поток держит свой
+    обычный словарь, который сбрасывается при изменении снимка реестра
+    (`token`: число реализаций и токен ABC) и при переполнении.
+    Замена реализации для уже зарегистрированного типа снимок не меняет -
+    регистрируйте реализации до первого форматирования.
+    """
+
+    token: tuple[int, object] = (-1, None)
+    impls: dict[type, Callable[..., str]]
+
+
+_dispatch_cache = _DispatchCache()
+
+
+def _dispatch_table() -> dict[type, Callable[..., str]]:
+    cache = _dispatch_cache
+    token = (len(pretty_repr.registry), get_cache_token())
+    if cache.token != token or len(cache.impls) >= _DISPATCH_CACHE_SIZE:
+        cache.token = token
+        cache.impls = {}
+    return cache.impls
+
+
+class _Frame:
+    """Разворачиваемый узел: дочерние объекты и сборка строки из их представлений."""
+
+    __slots__ = (
+        'children',
+        'depth',
+        'finish',
+        'keys',
+        'memo',
+        'obj',
+        'position',
+        'results',
+        'rules',
+    )
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        obj: Any,  # noqa: ANN401
+        depth: int,
+        children: list[Any],
+        keys: Union[list[Any], None],
+        rules: Rules,
+        finish: Callable[[list[str]], str],
+    ) -> None:
+        self.obj = obj
+        self.depth = depth
+        self.children = children
+        self.keys = keys
+        self.rules = rules
+        self.finish = finish
+        self.position = 0
+        self.results: list[str] = []
+        self.memo: Union[tuple[int, int, int], None] = None
+
+
+class _Renderer:
+    """
+    Обход графа объектов на явном стеке.
+
+    `active` - id объектов на текущем пути (для обнаружения циклов),
+    `done` - уже выведенные объекты (ссылки держим, чтобы id не переиспользовался).
+    Каждый изменяемый контейнер и объект разворачивается не более одного раза,
+    повторы выводятся как `<ref ...>`. Кортежи неизменяемы, и компилятор
+    переиспользует одинаковые константы, поэтому повтор небольшого кортежа
+    (до `_MAX_REPEATED_LENGTH` символов) выводится полностью - готовой строкой
+    из `rendered` (с учетом глубины и правил).
+    Правила скрытия (`Redactor`) передаются от узла к дочерним по ключам
+    словарей и именам атрибутов.
+    """
+
+    __slots__ = ('active', 'config', 'done', 'impls', 'redactor', 'rendered')
+
+    def __init__(self, config: LogConfig) -> None:
+        self.config = config
+        self.impls = _dispatch_table()
+        self.redactor = config.redactor if config.redactor.active else None
+        self.active: set[int] = set()
+        self.done: dict[int, Any] = {}
+        self.rendered: dict[tuple[int, int, int], tuple[tuple, str]] = {}
+
+    def render(self, obj: Any, depth: int, rules: Rules = None) -> str:  # noqa: ANN401
+        node = self._visit(obj, depth, rules)
+        if isinstance(node, str):
+            return node
+        stack = [node]
+        while stack:
+            frame = stack[-1]
+            if frame.position < len(frame.children):
+                child = frame.children[frame.position]
+                rules = frame.rules
+                if self.redactor is not None and frame.keys is not None:
+                    rules = self.redactor.child(rules, frame.keys[frame.position])
+                frame.position += 1
+                if rules is REDACT:
+                    frame.results.append(REDACTED)
+                    continue
+                node = self._visit(child, frame.depth + 1, rules)
+                if isinstance(node, str):
+                    frame.results.append(node)
+                else:
+                    stack.append(node)
+                continue
+            stack.pop()
+            key = id(frame.obj)
+            self.active.discard(key)
+            text = frame.finish(frame.results)
+            if frame.memo is None:
+                self.done[key] = frame.obj
+            else:
+                # объект держим вместе со строкой, чтобы id не переиспользовался
+                self.rendered[frame.memo] = (frame.obj, text)
+            if not stack:
+                return text
+            stack[-1].results.append(text)
+        return ''  # pragma: no cover
+
+    def _visit(  # noqa: PLR0911
+        self,
+        obj: Any,  # noqa: ANN401
+        depth: int,
+        rules: Rules,
+    ) -> Union[str, _Frame]:
+        cls = type(obj)
+        impl = self.impls.get(cls)
+        if impl is None:
+            impl = self.impls[cls] = pretty_repr.dispatch(cls)
+        if impl not in _EXPANDED:
+            return impl(obj, self.config, depth)
+        if isinstance(obj, (list, tuple, set, dict)):
+            if not obj:
+                return 'dict()' if isinstance(obj, dict) else f'{type(obj).__name__}()'
+            if isinstance(obj, tuple):
+                return self._tuple(obj, depth, rules)
+            return self._guard(obj) or self._container_frame(obj, depth, rules)
+        if isinstance(obj, _CALLABLES):
+            with suppress(Exception):
+                return _get_function_repr(obj, self.config, depth)
+        if depth > self.config.max_depth:
+            return '...'
+        if not self.config.show_complex_args:
+            if isinstance(obj, (Exception, datetime)):
+                return repr(obj)
+            return f'<{obj.__class__.__name__}>'
+        return self._guard(obj) or self._object_frame(obj, depth, rules)
+
+    def _tuple(self, obj: tuple, depth: int, rules: Rules) -> Union[str, _Frame]:
+        """Кортеж: повтор небольшого кортежа выводится полностью."""
+        memo = (id(obj), depth, id(rules))
+        rendered = self.rendered.get(memo)
+        if rendered is not None:
+            text = rendered[1]
+            if len(text) <= _MAX_REPEATED_LENGTH:
+                return text
+            return f'<ref tuple@{id(obj):#x}>'
+        if id(obj) in self.active:
+            return f'<cycle tuple@{id(obj):#x}>'
+        self.active.add(id(obj))
+        frame = self._container_frame(obj, depth, rules)
+        frame.memo = memo
+        return frame
+
+    def _guard(self, obj: Any) -> Union[str, None]:  # noqa: ANN401
+        """Проверка на цикл и повтор; отмечает объект как текущий."""
+        key = id(obj)
+        if key in self.active:
+            return f'<cycle {type(obj).__name__}@{key:#x}>'
+        if key in self.done:
+            return f'<ref {type(obj).__name__}@{key:#x}>'
+        self.active.add(key)
+        return None
+
+    def _container_frame(
+        self,
+        obj: Union[list, tuple, set, dict],
+        depth: int,
+        rules: Rules,
+    ) -> _Frame:
+        truncated = bool(self.config.max_arg_length) and len(obj) > _MAX_ITEMS
+        tail = ['...'] if truncated else []
+        if isinstance(obj, dict):
+            keys = list(islice(obj, _MAX_ITEMS))
+
+            def _finish_dict(results: list[str]) -> str:
+                items = [f'{k}: {v}' for k, v in zip(keys, results)]
+                return f'dict({", ".join(items + tail)})'
+
+            return _Frame(obj, depth, [obj[k] for k in keys], keys, rules, _finish_dict)
+
+        name = type(obj).__name__
+        children = list(islice(obj, _MAX_ITEMS) if truncated else obj)
+
+        def _finish_sequence(results: list[str]) -> str:
+            return f'{name}({", ".join(results + tail)})'
+
+        return _Frame(obj, depth, children, None, rules, _finish_sequence)
+
+    def _object_frame(
+        self,
+        obj: Any,  # noqa: ANN401
+        depth: int,
+        rules: Rules,
+    ) -> Union[str, _Frame]:
+        name = obj.__class__.__name__
+        try:
+            attrs = [
+                (k, v)
+                for k, v in inspect.getmembers(obj)
+                if not k.startswith('_') and not inspect.ismethod(v)
+            ]
+        except Exception:  # noqa: BLE001
+            try:
+                attrs = [(k, v) for k, v in obj.__dict__.items() if not k.startswith('_')]
+            except Exception:  # noqa: BLE001
+                self.active.discard(id(obj))
+                return f'{name} instance'
+        keys = [k for k, _ in attrs]
+
+        def _finish_object(results: list[str]) -> str:
+            return f'{name}({dict(zip(keys, results))})'
+
+        return _Frame(obj, depth, [v for _, v in attrs], keys, rules, _finish_object)
+
+
+def _get_function_repr(obj: Callable[..., Any], config: LogConfig, depth: int) -> str:
+    """
+    Представление вызываемого объекта по закэшированному шаблону сигнатуры.
+
+    Значения по умолчанию скрываются правилами `skipped_args` по имени параметра.
+    """
+    name, params, returns = _get_function_template(obj)
+    rendered = []
+    for param, param_name, default in params:
+        if default is _NO_DEFAULT:
+            rendered.append(param)
+            continue
+        rules = config.redactor.root(param_name) if config.redactor.active else None
+        default_repr = (
+            REDACTED
+            if rules is REDACT
+            else _Renderer(config).render(default, depth + 1, rules)
+        )
+        rendered.append(f'{param} = {default_repr}')
+    return f'{name}({", ".join(rendered)}){returns}'
+
+
+_NO_DEFAULT = inspect.Parameter.empty
+_FunctionTemplate = tuple[str, tuple[tuple[str, str, Any], ...], str]
+
+
+class _TemplateTables:
+    """Шаблоны сигнатур одного потока по `id`: функции и `__func__` связанных методов."""
+
+    __slots__ = ('__weakref__', 'bound', 'functions')
+
+    def __init__(self) -> None:
+        self.functions: dict[int, _FunctionTemplate] = {}
+        self.bound: dict[int, _FunctionTemplate] = {}
+
+
+class _ThreadTemplates(threading.local):
+    """Таблицы шаблонов текущего потока, создаются при первом обращении."""
+
+    tables: Union[_TemplateTables, None] = None
+
+
+_thread_templates = _ThreadTemplates()
+_template_tables: WeakSet[_TemplateTables] = WeakSet()
+_tracked_functions: set[int] = set()
+# финализатор может сработать при сборке мусора внутри захваченной блокировки
+_templates_lock = threading.RLock()
+
+
+def _get_function_template(obj: Callable[..., Any]) -> _FunctionTemplate:
+    """
+    Шаблон сигнатуры: имя, параметры (строка и значение по умолчанию), ` -> ...`.
+
+    Шаблон не зависит от конфигурации и кэшируется отдельно в каждом потоке
+    в обычном словаре по `id` функции: чтение не создает слабых ссылок
+    на общую для потоков функцию. Записи удаляет из всех потоков один
+    `weakref.finalize` на функцию. Связанные методы создаются заново
+    при каждом обращении, поэтому для них ключом служит `__func__`.
+    """
+    tables = _thread_templates.tables
+    if tables is None:
+        tables = _thread_templates.tables = _TemplateTables()
+        with _templates_lock:
+            _template_tables.add(tables)
+    if isinstance(obj, MethodType):
+        cache, key = tables.bound, obj.__func__
+    else:
+        cache, key = tables.functions, obj
+    template = cache.get(id(key))
+    if template is None:
+        template = _build_function_template(obj)
+        if _track_function(key):
+            cache[id(key)] = template
+    return template
+
+
+def _track_function(func: Callable[..., Any]) -> bool:
+    """Один раз на функцию регистрирует удаление ее шаблонов при сборке."""
+    key = id(func)
+    with _templates_lock:
+        if key in _tracked_functions:
+            return True
+        try:
+            finalize(func, _forget_templates, key)
+        except TypeError:  # объект не поддерживает слабые ссылки
+            return False
+        _tracked_functions.add(key)
+        return True
+
+
+def _forget_templates(key: int) -> None:
+    with _templates_lock:
+        _tracked_functions.discard(key)
+        for tables in _template_tables:
+            tables.functions.pop(key, None)
+            tables.bound.pop(key, None)
+
+
+def _build_function_template(obj: Callable[..., Any]) -> _FunctionTemplate:
+    sig = inspect.signature(obj)
+    # аргументы, связанные в partial, - значения вызова, а не умолчания:
+    # их значения не выводим
+    bound = obj.keywords if isinstance(obj, partial) else {}
+    params = []
+    for param in sig.parameters.values():
+        param_str = param.name
+        if param.annotation is not inspect.Parameter.empty:
+            param_str = f'{param_str}: {_format_annotation(param.annotation)}'
+        if param.kind == inspect.Parameter.VAR_POSITIONAL:
+            param_str = f'*{param_str}'
+        elif param.kind == inspect.Parameter.VAR_KEYWORD:
+            param_str = f'**{param_str}'
+        default = _NO_DEFAULT if param.name in bound else param.default
+        params.append((param_str, param.name, default))
+    if isinstance(obj, partial):
+        name = f'partial({getattr(obj.func, "__name__", type(obj.func).__name__)})'
+    else:
+        name = getattr(obj, '__name__', None) or obj.__class__.__name__
+    returns = ''
+    if sig.return_annotation is not inspect.Signature.empty:
+        returns = f' -> {_format_annotation(sig.return_annotation)}'
+    return name, tuple(params), returns
+
+
+def _format_annotation(annotation: Any) -> str:  # noqa: ANN401, PLR0911
     """
     Форматируем аннотацию.
 
-    >>> _format_annotation(<class 'str'>)
+    >>> _format_annotation(str)
     'str'
-    >>> _format_annotation(<class 'int'>)
-    'int'
+    >>> _format_annotation(dict[str, list[int]])
+    'dict[str, list[int]]'
+    >>> _format_annotation(Union[int, None])
+    'int | None'
     """
-    return str(annotation).replace('<class ', '').replace("'", '').replace('>', '')
+    if annotation is None or annotation is NoneType:
+        return 'None'
+    if isinstance(annotation, str):
+        return annotation
+    if isinstance(annotation, list):
+        return f'[{", ".join(_format_annotation(a) for a in annotation)}]'
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is None:
+        if isinstance(annotation, type):
+            return _format_type(annotation)
+        return getattr(annotation, '__name__', None) or repr(annotation)
+    if origin is Union or origin is UnionType:
+        return ' | '.join(_format_annotation(a) for a in args)
+    if origin is Literal:
+        return f'Literal[{", ".join(repr(a) for a in args)}]'
+    if origin is Annotated:
+        return _format_annotation(args[0])
+    name = _format_type(origin) if isinstance(origin, type) else repr(origin)
+    if not args:
+        return name
+    return f'{name}[{", ".join(_format_annotation(a) for a in args)}]'
+
+
+def _format_type(cls: type) -> str:
+    if cls.__module__ == 'builtins':
+        return cls.__qualname__
+    if cls.__module__ == 'collections.abc':
+        return cls.__name__
+    return f'{cls.__module__}.{cls.__qualname__}'
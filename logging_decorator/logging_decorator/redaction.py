@@ -0,0 +1,86 @@
+import re
+from fnmatch import translate
+from typing import Iterable, Union
+
+REDACTED = '<redacted>'
+_GLOB_CHARS = frozenset('*?[')
+_GLOB_CACHE_SIZE = 4096
+
+
+class _Redact:
+    """Маркер узла, значение которого скрывается."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return 'REDACT'
+
+
+REDACT = _Redact()
+Rules = Union[dict[str, 'Rules'], _Redact, None]
+
+
+class Redactor:
+    """
+    Скомпилированные правила `LogConfig.skipped_args`.
+
+    - `secret` - аргумент (или локальная переменная) верхнего уровня;
+    - `request.headers.authorization` - путь по ключам словарей и атрибутам
+      объектов, элементы списков путь не удлиняют; сегмент `*` - любой ключ;
+    - `*token*` - шаблон без точек, применяется к ключу на любой глубине.
+
+    Имена, пути и шаблоны сравниваются без учета регистра (`Token`,
+    `X-Auth-Token`, заголовок `Authorization`).
+    Пути собираются в префиксное дерево, шаблоны - в одно регулярное выражение
+    с кэшем результатов по ключу, поэтому проверка узла стоит O(1).
+    Кэш общий для потоков и после заполнения только читается: ключи сверх
+    `_GLOB_CACHE_SIZE` проверяются выражением напрямую.
+    """
+
+    __slots__ = ('_glob', '_glob_cache', 'active', 'trie')
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """Компилирует правила."""
+        self.trie: dict[str, Rules] = {}
+        globs = []
+        for pattern in patterns:
+            if '.' in pattern:
+                self._insert(pattern.casefold().split('.'))
+            elif _GLOB_CHARS.intersection(pattern):
+                globs.append(translate(pattern))
+            else:
+                self.trie[pattern.casefold()] = REDACT
+        self._glob = re.compile('|'.join(globs), re.IGNORECASE) if globs else None
+        self._glob_cache: dict[str, bool] = {}
+        self.active = bool(self.trie or globs)
+
+    def root(self, name: str) -> Rules:
+        """Правила для значения аргумента верхнего уровня."""
+        return self.child(self.trie, name)
+
+    def child(self, rules: Rules, key: object) -> Rules:
+        """Правила для вложенного значения по ключу или имени атрибута."""
+        if self._glob is not None:
+            key = str(key)
+            matched = self._glob_cache.get(key)
+            if matched is None:
+                matched = bool(self._glob.match(key))
+                if len(self._glob_cache) < _GLOB_CACHE_SIZE:
+                    self._glob_cache[key] = matched
+            if matched:
+                return REDACT
+        if not rules or rules is REDACT:
+            return None
+        nested = rules.get(str(key).casefold())  # type: ignore
+        return nested if nested is not None else rules.get('*')  # type: ignore
+
+    def _insert(self, path: list[str]) -> None:
+        node = self.trie
+        for segment in path[:-1]:
+            nested = node.get(segment)
+            if nested is REDACT:
+                return
+            if nested is None:
+                nested = node[segment] = {}
+            node = nested  # type: ignore
+        node[path[-1]] = REDACT
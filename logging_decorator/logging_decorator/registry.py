@@ -0,0 +1,180 @@
+import threading
+import weakref
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Iterable, Union
+
+from .config import LogConfig
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Неизменяемый снимок конфигурации, который обертка читает на каждом вызове."""
+
+    version: int
+    enabled: bool
+    config: LogConfig
+
+
+class Switch:
+    """Переключатель логирования, общий для группы обернутых функций."""
+
+    __slots__ = ('_enabled', 'entries')
+
+    def __init__(self, *, enabled: bool = True) -> None:
+        """Создает переключатель в заданном состоянии."""
+        self._enabled = enabled
+        self.entries: list[RegistryEntry] = []
+
+    @property
+    def enabled(self) -> bool:
+        """Включено ли логирование группы."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        registry.refresh(self.entries)
+
+
+class RegistryEntry:
+    """Запись реестра о декорированной функции."""
+
+    __slots__ = ('__weakref__', 'base_config', 'name', 'snapshot', 'switch')
+
+    def __init__(
+        self,
+        name: str,
+        base_config: LogConfig,
+        snapshot: ConfigSnapshot,
+        switch: Union[Switch, None],
+    ) -> None:
+        """Создает запись с начальным снимком конфигурации."""
+        self.name = name
+        self.base_config = base_config
+        self.snapshot = snapshot
+        self.switch = switch
+
+
+class LogRegistry:
+    """
+    Реестр декорированных функций с горячей перенастройкой.
+
+    Правила `configure` применяются по glob-шаблону к полному имени функции
+    (`module.qualname`) - в том числе к функциям, задекорированным позже.
+    Обновление атомарно: обертка видит либо старый, либо новый снимок целиком.
+    """
+
+    def __init__(self) -> None:
+        """Создает пустой реестр."""
+        self._entries: weakref.WeakSet[RegistryEntry] = weakref.WeakSet()
+        self._rules: list[tuple[str, dict[str, Any]]] = []
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        func: Callable[..., Any],
+        config: LogConfig,
+        switch: Union[Switch, None] = None,
+    ) -> RegistryEntry:
+        """Регистрирует функцию и возвращает ее запись."""
+        name = _qualified_name(func)
+        with self._lock:
+            snapshot = self._make_snapshot(name, config, switch)
+            entry = RegistryEntry(name, config, snapshot, switch)
+            self._entries.add(entry)
+        if switch is not None:
+            switch.entries.append(entry)
+        return entry
+
+    def configure(
+        self,
+        pattern: str = '*',
+        *,
+        enabled: Union[bool, None] = None,
+        **changes: Any,  # noqa: ANN401
+    ) -> int:
+        """
+        Меняет конфигурацию функций, подходящих под шаблон.
+
+        Возвращает количество затронутых функций.
+        """
+        rule = dict(changes)
+        if enabled is not None:
+            rule['enabled'] = enabled
+        LogConfig.from_config(LogConfig(), **changes)  # проверка имен полей
+        with self._lock:
+            # ключи, заданные заново для того же шаблона, в прежних правилах
+            # уже ничего не меняют: убираем их, чтобы список правил не рос
+            rules = []
+            for rule_pattern, previous in self._rules:
+                if rule_pattern == pattern:
+                    previous = {k: v for k, v in previous.items() if k not in rule}  # noqa: PLW2901
+                    if not previous:
+                        continue
+                rules.append((rule_pattern, previous))
+            rules.append((pattern, rule))
+            self._rules = rules
+            return self._refresh(e for e in self._entries if fnmatchcase(e.name, pattern))
+
+    def enable(self, pattern: str = '*') -> int:
+        """Включает логирование функций, подходящих под шаблон."""
+        return self.configure(pattern, enabled=True)
+
+    def disable(self, pattern: str = '*') -> int:
+        """Выключает логирование функций, подходящих под шаблон."""
+        return self.configure(pattern, enabled=False)
+
+    def reset(self) -> None:
+        """Сбрасывает все правила к конфигурации, заданной при декорировании."""
+        with self._lock:
+            self._rules.clear()
+            self._refresh(self._entries)
+
+    def refresh(self, entries: Iterable[RegistryEntry]) -> None:
+        """Пересчитывает снимки указанных записей."""
+        with self._lock:
+            self._refresh(entries)
+
+    def get(self, pattern: str = '*') -> dict[str, ConfigSnapshot]:
+        """Текущие снимки функций, подходящих под шаблон."""
+        with self._lock:
+            entries = list(self._entries)
+        return {e.name: e.snapshot for e in entries if fnmatchcase(e.name, pattern)}
+
+    def _refresh(self, entries: Iterable[RegistryEntry]) -> int:
+        self._version += 1
+        count = 0
+        for entry in list(entries):
+            entry.snapshot = self._make_snapshot(
+                entry.name,
+                entry.base_config,
+                entry.switch,
+            )
+            count += 1
+        return count
+
+    def _make_snapshot(
+        self,
+        name: str,
+        base_config: LogConfig,
+        switch: Union[Switch, None],
+    ) -> ConfigSnapshot:
+        changes: dict[str, Any] = {}
+        for pattern, rule in self._rules:
+            if fnmatchcase(name, pattern):
+                changes.update(rule)
+        enabled = changes.pop('enabled', True) and (switch is None or switch.enabled)
+        config = LogConfig.from_config(base_config, **changes) if changes else base_config
+        return ConfigSnapshot(self._version, enabled, config)
+
+
+def _qualified_name(func: Callable[..., Any]) -> str:
+    """Полное имя функции; для partial и вызываемых экземпляров - имя их типа."""
+    module = getattr(func, '__module__', None) or type(func).__module__
+    qualname = getattr(func, '__qualname__', None) or type(func).__qualname__
+    return f'{module}.{qualname}'
+
+
+registry = LogRegistry()
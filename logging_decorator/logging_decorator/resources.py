@@ -0,0 +1,190 @@
+import gc
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, fields
+from typing import Any, Awaitable, Coroutine, Generator, TypeVar, Union
+
+from .config import LogConfig
+
+T = TypeVar('T')
+
+
+@dataclass
+class ResourceUsage:
+    """Потребление ресурсов за один вызов функции."""
+
+    cpu_time: Union[float, None] = None
+    memory_delta: Union[int, None] = None
+    memory_peak: Union[int, None] = None
+    gc_collections: Union[int, None] = None
+    suspensions: Union[int, None] = None
+    running_time: Union[float, None] = None
+    awaiting_time: Union[float, None] = None
+
+    def as_dict(self) -> dict[str, Union[float, int]]:
+        """Только измеренные метрики."""
+        return {
+            f.name: value
+            for f in fields(self)
+            if (value := getattr(self, f.name)) is not None
+        }
+
+    def __str__(self) -> str:
+        """Строковое представление метрик."""
+        parts = []
+        if self.cpu_time is not None:
+            parts.append(f'CPU {self.cpu_time:.4f} сек.')
+        if self.memory_delta is not None:
+            memory = f'память {self.memory_delta:+d} Б'
+            if self.memory_peak is not None:
+                memory = f'{memory}, пик {self.memory_peak} Б'
+            parts.append(memory)
+        if self.gc_collections is not None:
+            parts.append(f'сборок мусора {self.gc_collections}')
+        if self.suspensions is not None:
+            parts.append(
+                f'приостановок {self.suspensions}, '
+                f'работа {self.running_time:.4f} сек., '
+                f'ожидание {self.awaiting_time:.4f} сек.',
+            )
+        return ', '.join(parts)
+
+
+class ResourceMeter:
+    """
+    Замер ресурсов одного вызова.
+
+    Снимаются только метрики, включенные в `LogConfig`.
+    Память считается через `tracemalloc`, только если он уже запущен
+    (`tracemalloc.start()`). Пик памяти в `tracemalloc` общий на процесс,
+    поэтому его снимает только внешний из пересекающихся замеров (вложенные
+    вызовы, другие потоки и задачи): у остальных `memory_peak` = None.
+    Для асинхронных функций CPU считается по шагам корутины,
+    чтобы не учитывать работу других задач event loop.
+    """
+
+    __slots__ = (
+        '_cpu_start',
+        '_gc_start',
+        '_memory',
+        '_memory_start',
+        '_peak',
+        '_steps',
+        'config',
+        'usage',
+    )
+
+    def __init__(self, config: LogConfig, *, is_async: bool = False) -> None:
+        """Запоминает начальные значения включенных метрик."""
+        self.config = config
+        self.usage = ResourceUsage()
+        self._steps = is_async and (config.measure_cpu_time or config.measure_await)
+        if config.measure_gc:
+            self._gc_start = _gc_collections()
+        self._memory = config.measure_memory and tracemalloc.is_tracing()
+        if self._memory:
+            self._peak = _memory_windows.open()
+            self._memory_start = tracemalloc.get_traced_memory()[0]
+        if config.measure_cpu_time and not self._steps:
+            self._cpu_start = time.thread_time()
+
+    def measure(self, coro: Coroutine[Any, Any, T]) -> Awaitable[T]:
+        """Оборачивает корутину для замера по шагам, если это нужно."""
+        if not self._steps:
+            return coro
+        return _MeasuredCoroutine(coro, self)
+
+    def stop(self) -> ResourceUsage:
+        """Завершает замер и возвращает метрики (вызывается и при ошибке)."""
+        usage = self.usage
+        if self.config.measure_cpu_time and not self._steps:
+            usage.cpu_time = time.thread_time() - self._cpu_start
+        if self._memory:
+            self._memory = False
+            _memory_windows.close()
+            if tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                usage.memory_delta = current - self._memory_start
+                if self._peak:
+                    usage.memory_peak = max(peak - self._memory_start, 0)
+        if self.config.measure_gc:
+            usage.gc_collections = _gc_collections() - self._gc_start
+        return usage
+
+
+class _MemoryWindows:
+    """Счетчик открытых замеров памяти: сбрасывать пик может только первый."""
+
+    __slots__ = ('_active', '_lock')
+
+    def __init__(self) -> None:
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def open(self) -> bool:
+        """Открывает замер; True, если он единственный и пик сброшен для него."""
+        with self._lock:
+            self._active += 1
+            if self._active > 1:
+                return False
+            tracemalloc.reset_peak()
+            return True
+
+    def close(self) -> None:
+        with self._lock:
+            self._active -= 1
+
+
+_memory_windows = _MemoryWindows()
+
+
+class _MeasuredCoroutine:
+    """Awaitable, который прогоняет корутину по шагам и замеряет каждый шаг."""
+
+    __slots__ = ('_coro', '_meter')
+
+    def __init__(self, coro: Coroutine[Any, Any, Any], meter: ResourceMeter) -> None:
+        self._coro = coro
+        self._meter = meter
+
+    def __await__(self) -> Generator[Any, Any, Any]:  # noqa: C901
+        coro, config = self._coro, self._meter.config
+        measure_cpu = config.measure_cpu_time
+        suspensions, running, cpu = 0, 0.0, 0.0
+        started = time.perf_counter()
+        value: Any = None
+        error: Union[BaseException, None] = None
+        try:
+            while True:
+                step_start = time.perf_counter()
+                cpu_start = time.thread_time() if measure_cpu else 0.0
+                try:
+                    future = coro.send(value) if error is None else coro.throw(error)
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    running += time.perf_counter() - step_start
+                    if measure_cpu:
+                        cpu += time.thread_time() - cpu_start
+                suspensions += 1
+                try:
+                    value, error = (yield future), None
+                except GeneratorExit:
+                    coro.close()
+                    raise
+                except BaseException as exc:  # noqa: BLE001
+                    value, error = None, exc
+        finally:
+            usage = self._meter.usage
+            if measure_cpu:
+                usage.cpu_time = cpu
+            if config.measure_await:
+                usage.suspensions = suspensions
+                usage.running_time = running
+                usage.awaiting_time = time.perf_counter() - started - running
+
+
+def _gc_collections() -> int:
+    """Общее число сборок мусора по всем поколениям."""
+    return sum(stats['collections'] for stats in gc.get_stats())
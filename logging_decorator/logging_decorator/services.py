@@ -4,7 +4,7 @@ from logging import Logger
 from typing import Any, Awaitable, Callable, ParamSpec, TypeGuard, TypeVar, Union
 
 from logging_decorator.logging_decorator.config import LogConfig
-from logging_decorator.logging_decorator.pretty_repr import pretty_repr
+from logging_decorator.logging_decorator.pretty_repr import pretty_repr_named
 
 
 def get_default_logger() -> Logger:
@@ -18,12 +18,17 @@ def get_signature_repr(
     args: tuple[Any, ...],
     kwargs: dict[str, Any],
     config: LogConfig,
+    signature: Union[inspect.Signature, None] = None,
 ) -> str:
-    """Форматирует аргументы функции в читаемый вид с переносами строк."""
+    """
+    Форматирует аргументы функции в читаемый вид с переносами строк.
+
+    Заранее вычисленная `signature` избавляет от вызова `inspect.signature`.
+    """
     if not config.include_args:
         return ''
     try:
-        sig = inspect.signature(func)
+        sig = signature or inspect.signature(func)
         bound = sig.bind(*args, **kwargs)
         bound.apply_defaults()
         params = bound.arguments.items()
@@ -31,10 +36,10 @@ def get_signature_repr(
         params = list(enumerate(args)) + list(kwargs.items())  # type: ignore
     arg_lines = []
     for name, value in params:
-        if name in config.skipped_args:
+        value_repr = pretty_repr_named(str(name), value, config)
+        if value_repr is None:
             continue
         type_info = f': {type(value).__name__}' if config.show_types else ''
-        value_repr = pretty_repr(value, config)
         arg_lines.append(f'{name}{type_info} = {value_repr}')
     return '\n  '.join(arg_lines) if arg_lines else ''
 
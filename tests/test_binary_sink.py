@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from logging_decorator import BinarySink, LogConfig, log
+from logging_decorator.logging_decorator.binary_decode import main
+from logging_decorator.logging_decorator.binary_sink import MAX_CACHED_TEXTS, read_records
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_roundtrip(tmp_path: Path) -> None:
+    """Тест записи и чтения записей декоратора."""
+    sink = BinarySink(tmp_path / 'calls.bin', capacity=100, record_start=True)
+
+    @log(sink)
+    def target(a: int) -> int:
+        if a < 0:
+            msg = 'Отрицательное число'
+            raise ValueError(msg)
+        return a
+
+    target(1)
+    target(1)
+    with pytest.raises(ValueError, match='Отрицательное'):
+        target(-1)
+    sink.close()
+
+    records = list(read_records(tmp_path / 'calls.bin'))
+    assert [r['status'] for r in records] == [
+        'start',
+        'success',
+        'start',
+        'success',
+        'start',
+        'error',
+    ]
+    assert {r['func'] for r in records} == {'target'}
+    assert 'a: int = 1' in records[0]['text']
+    assert records[1]['elapsed'] >= 0
+    assert records[0]['elapsed'] is None
+    assert 'Отрицательное число' in records[-1]['text']
+    assert 'a: int = -1' in records[-1]['text']
+    assert records[0]['timestamp'] <= records[-1]['timestamp']
+    strings = (tmp_path / 'calls.bin.strings').read_bytes()
+    assert strings.count(b'target') == 1
+
+
+def test_rotation(tmp_path: Path) -> None:
+    """Тест ротации сегментов при заполнении."""
+    sink = BinarySink(tmp_path / 'calls.bin', capacity=2, backup_count=1)
+
+    @log(sink, LogConfig(include_args=False))
+    def target() -> None: ...
+
+    for _ in range(5):
+        target()
+    sink.close()
+
+    assert len(list(read_records(tmp_path / 'calls.bin'))) == 1
+    assert len(list(read_records(tmp_path / 'calls.bin.1'))) == 2
+    assert not (tmp_path / 'calls.bin.2').exists()
+
+
+def test_one_record_per_call(tmp_path: Path) -> None:
+    """Тест записи одной записи на вызов со сводкой аргументов."""
+    sink = BinarySink(tmp_path / 'calls.bin')
+
+    @log(sink)
+    def target(a: int) -> int:
+        return a
+
+    target(1)
+    sink.flush()
+    records = list(read_records(tmp_path / 'calls.bin'))
+    target(2)
+    sink.close()
+
+    assert [r['status'] for r in records] == ['success']
+    assert 'a: int = 1' in records[0]['text']
+    records = list(read_records(tmp_path / 'calls.bin'))
+    assert [r['text'] for r in records] == ['a: int = 1', 'a: int = 2']
+
+
+def test_threads(tmp_path: Path) -> None:
+    """Тест записи из нескольких потоков с ротацией: без потерь и дублей."""
+    sink = BinarySink(tmp_path / 'calls.bin', capacity=1000, backup_count=3)
+
+    @log(sink)
+    def target(thread: int, call: int) -> None: ...
+
+    def _worker(thread: int) -> None:
+        for call in range(300):
+            target(thread, call)
+
+    with ThreadPoolExecutor(4) as pool:
+        list(pool.map(_worker, range(4)))
+    sink.close()
+
+    segments = [tmp_path / 'calls.bin', tmp_path / 'calls.bin.1']
+    texts = [r['text'] for path in segments for r in read_records(path)]
+    expected = [
+        f'thread: int = {thread}\n  call: int = {call}'
+        for thread in range(4)
+        for call in range(300)
+    ]
+    assert sorted(texts) == sorted(expected)
+
+
+def test_write_after_close(tmp_path: Path) -> None:
+    """Тест вызовов после закрытия приемника: записи игнорируются без ошибок."""
+    sink = BinarySink(tmp_path / 'calls.bin')
+
+    @log(sink)
+    def target(a: int) -> int:
+        return a
+
+    target(1)
+    sink.close()
+    assert target(2) == 2
+    assert len(list(read_records(tmp_path / 'calls.bin'))) == 1
+
+
+def test_unique_arguments_not_cached(tmp_path: Path) -> None:
+    """Тест ограничения кэша сводок аргументов и записи без дедупликации."""
+    sink = BinarySink(tmp_path / 'calls.bin', record_start=True)
+
+    @log(sink)
+    def target(a: int) -> int:
+        return a
+
+    calls = MAX_CACHED_TEXTS + 100
+    for i in range(calls):
+        target(i)
+    assert len(sink._segment.texts) <= MAX_CACHED_TEXTS  # noqa: SLF001
+    sink.close()
+
+    records = list(read_records(tmp_path / 'calls.bin'))
+    assert len(records) == 2 * calls
+    assert records[-1]['text'].endswith(f'a: int = {calls - 1}')
+
+
+def test_missing_strings(tmp_path: Path) -> None:
+    """Тест записей, ссылающихся на строки, не сброшенные на диск."""
+    path = tmp_path / 'calls.bin'
+    sink = BinarySink(path)
+    log(sink)(lambda a: a)(1)
+    sink.flush()
+    strings = path.with_name('calls.bin.strings')
+    strings.write_bytes(strings.read_bytes()[:-3])
+
+    (record,) = read_records(path)
+    assert record['func'] == '<lambda>'
+    assert record['text'] is None
+    sink.close()
+
+
+def test_decoder_cli(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Тест декодера в JSON Lines и текст."""
+    sink = BinarySink(tmp_path / 'calls.bin')
+    log(sink, LogConfig(include_args=False))(lambda: None)()
+    sink.close()
+
+    main([str(tmp_path / 'calls.bin'), '--format', 'json'])
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)['status'] for line in lines] == ['success']
+
+    main([str(tmp_path / 'calls.bin')])
+    assert ' success <lambda> ' in capsys.readouterr().out
+
+
+def test_invalid_file(tmp_path: Path) -> None:
+    """Тест ошибки на чужом файле."""
+    (tmp_path / 'other.bin').write_bytes(b'0' * 64)
+    (tmp_path / 'other.bin.strings').write_bytes(b'')
+    with pytest.raises(ValueError, match='не является сегментом'):
+        list(read_records(tmp_path / 'other.bin'))
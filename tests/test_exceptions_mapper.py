@@ -1,10 +1,13 @@
+import asyncio
 import re
 from typing import Any, Awaitable, Callable, NoReturn, Union
 
 import pytest
 
 from exceptions_mapper import DetailedError, map_error
+from exceptions_mapper.map_err import request_context
 from logging_decorator import LogConfig
+from logging_decorator.logging_decorator.pretty_repr import pretty_repr
 from logging_decorator.logging_decorator.services import is_async
 
 
@@ -108,3 +111,102 @@ async def _check_is_raise(
     regex_pattern += '.*'
     with pytest.raises(error, match=regex_pattern):
         await f(arg) if is_async(f) else f(arg)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_map_error_async_keeps_traceback():
+    """Тестирование сохранения цепочки traceback в асинхронной функции."""
+    with pytest.raises(DetailedError) as exc_info:
+        await _func_test_async(1)
+    cause = exc_info.value.__cause__
+    assert isinstance(cause, ValueError)
+    tb = cause.__traceback__
+    codes = []
+    while tb is not None:
+        codes.append(tb.tb_frame.f_code.co_name)
+        tb = tb.tb_next
+    assert codes[-1] == '_func_test_async'
+    assert exc_info.value.to_dict()['details'] == 'a: int = 1'
+
+
+def test_map_error_renders_lazily():
+    """Тестирование отложенного форматирования контекста ошибки."""
+    with pytest.raises(DetailedError) as exc_info:
+        _func_test(1)
+    error = exc_info.value
+    assert 'details' not in vars(error)
+    assert error.details == 'a: int = 1'
+    assert 'a: int = 1' in str(error)
+
+
+@pytest.mark.asyncio
+async def test_map_error_details_type():
+    """Тестирование типа деталей ошибки в синхронной и асинхронной функциях."""
+    with pytest.raises(DetailedError) as sync_info:
+        _func_test(1)
+    with pytest.raises(DetailedError) as async_info:
+        await _func_test_async(1)
+    assert sync_info.value.details == async_info.value.details == 'a: int = 1'
+    assert DetailedError(details={'a': 1}).to_dict()['details'] == {'a': '1'}
+
+
+def test_request_context_not_shared():
+    """Тестирование контекста запроса: значение по умолчанию не изменяемо."""
+    with pytest.raises(TypeError):
+        request_context.get()['user'] = 'admin'  # type: ignore
+    token = request_context.set({'request_id': 1})
+    try:
+        with pytest.raises(DetailedError) as exc_info:
+            _func_test(1)
+    finally:
+        request_context.reset(token)
+    assert exc_info.value.to_dict()['context']['request_id'] == 1
+    assert dict(request_context.get()) == {}
+
+
+def test_map_error_redacts_locals():
+    """Тестирование скрытия вложенных значений в контексте и деталях ошибки."""
+    config = LogConfig(
+        skipped_args=['*token*', 'request.headers.authorization'],
+        max_depth=3,
+    )
+
+    @map_error(config=config)
+    def _handle(request: dict[str, Any]) -> None:
+        payload = {'api_token': 'SECRET1', 'id': 1}
+        msg = f'Ошибка {payload["id"]} {len(request)}'
+        raise ValueError(msg)
+
+    with pytest.raises(DetailedError) as exc_info:
+        _handle({'headers': {'authorization': 'SECRET2', 'host': 'example.org'}})
+    text = str(exc_info.value)
+    assert 'SECRET1' not in text
+    assert 'SECRET2' not in text
+    context = exc_info.value.to_dict()['context']
+    assert context['locals']['payload'] == 'dict(api_token: <redacted>, id: 1)'
+    assert "host: 'example.org'" in context['args']['request']
+
+
+@pytest.mark.asyncio
+async def test_map_error_render_failure():
+    """Тестирование сбоя форматирования: все равно пробрасывается DetailedError."""
+
+    class Unstable:
+        """Объект, который меняется во время форматирования."""
+
+    @pretty_repr.register(Unstable)
+    def _(obj: Unstable, config: LogConfig, depth: int = 0) -> str:  # noqa: ARG001
+        msg = 'dictionary changed size during iteration'
+        raise RuntimeError(msg)
+
+    @map_error()
+    async def _handle(item: Unstable) -> None:
+        await asyncio.sleep(0)
+        msg = f'Не удалось обработать {item!r}'
+        raise ValueError(msg)
+
+    with pytest.raises(DetailedError) as exc_info:
+        await _handle(Unstable())
+    error = exc_info.value
+    assert error.details == error.message
+    assert 'changed size' in error.to_dict()['context']['render_error']
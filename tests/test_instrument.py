@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import types
+from typing import TYPE_CHECKING
+
+from logging_decorator import instrument_module, log, log_class
+
+if TYPE_CHECKING:
+    from tests.conftest import MockLogger
+
+
+def _logged_funcs(logger: MockLogger) -> list[str]:
+    return [
+        m['extra']['func'] for m in logger.messages if m['extra']['status'] == 'start'
+    ]
+
+
+def test_log_class_wraps_all_kinds(logger: MockLogger) -> None:
+    """Тест оборачивания методов всех видов."""
+
+    @log_class(logger, properties=True, exclude=['skipped'])
+    class Service:
+        def method(self, a: int) -> int:  # noqa: PLR6301
+            return a
+
+        async def async_method(self) -> str:  # noqa: PLR6301
+            return 'async'
+
+        @staticmethod
+        def static() -> str:
+            return 'static'
+
+        @classmethod
+        def klass(cls) -> str:
+            return cls.__name__
+
+        @property
+        def prop(self) -> int:
+            return 1
+
+        def skipped(self) -> None: ...
+
+        def _private(self) -> None: ...
+
+    service = Service()
+    assert service.method(1) == 1
+    assert asyncio.run(service.async_method()) == 'async'
+    assert Service.static() == 'static'
+    assert Service.klass() == 'Service'
+    assert service.prop == 1
+    service.skipped()
+    service._private()  # noqa: SLF001
+
+    assert _logged_funcs(logger) == ['method', 'async_method', 'static', 'klass', 'prop']
+    assert sorted(Service.__instrumentation__.wrapped) == [  # type: ignore
+        'async_method',
+        'klass',
+        'method',
+        'prop',
+        'static',
+    ]
+
+
+def test_log_class_toggle(logger: MockLogger) -> None:
+    """Тест выключения и включения логирования без переоборачивания."""
+
+    @log_class(logger)
+    class Service:
+        def method(self) -> int:  # noqa: PLR6301
+            return 1
+
+    instrumentation = Service.__instrumentation__  # type: ignore
+    instrumentation.disable()
+    assert Service().method() == 1
+    assert not logger.messages
+
+    instrumentation.enable()
+    Service().method()
+    assert _logged_funcs(logger) == ['method']
+
+
+def test_instrument_module(logger: MockLogger) -> None:
+    """Тест оборачивания функций и классов модуля."""
+    module = types.ModuleType('sample_module')
+    exec(  # noqa: S102
+        'from os.path import join\n'
+        'def public(): return 1\n'
+        'def excluded(): return 2\n'
+        'def _private(): return 3\n'
+        'class Repo:\n'
+        '    def get(self): return 4\n',
+        module.__dict__,
+    )
+    instrumentation = instrument_module(module, logger, exclude=['excluded'])
+
+    assert module.public() == 1
+    assert module.excluded() == 2
+    assert module._private() == 3  # noqa: SLF001
+    assert module.Repo().get() == 4
+    assert _logged_funcs(logger) == ['public', 'get']
+    assert instrumentation.wrapped == ['public', 'Repo.get']
+
+
+def test_instrument_module_twice(logger: MockLogger) -> None:
+    """Тест повторного оборачивания модуля: каждый вызов логируется один раз."""
+    module = types.ModuleType('sample_module')
+    exec(  # noqa: S102
+        'def public(): return 1\nclass Repo:\n    def get(self): return 2\n',
+        module.__dict__,
+    )
+    instrument_module(module, logger)
+    repeated = instrument_module(module, logger)
+
+    assert module.public() == 1
+    assert module.Repo().get() == 2
+    assert _logged_funcs(logger) == ['public', 'get']
+    assert repeated.wrapped == []
+    assert module.Repo.__instrumentation__ is not repeated
+
+
+def test_log_class_twice(logger: MockLogger) -> None:
+    """Тест повторного log_class и уже обернутых методов: один лог на вызов."""
+
+    @log_class(logger)
+    @log_class(logger)
+    class Service:
+        @log(logger)
+        def logged(self) -> int:  # noqa: PLR6301
+            return 1
+
+        @staticmethod
+        @log(logger)
+        def static() -> int:
+            return 2
+
+        def method(self) -> int:  # noqa: PLR6301
+            return 3
+
+    service = Service()
+    assert (service.logged(), service.static(), service.method()) == (1, 2, 3)
+    assert _logged_funcs(logger) == ['logged', 'static', 'method']
+    assert Service.__instrumentation__.wrapped == ['method']  # type: ignore
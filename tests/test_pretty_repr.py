@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import gc
+import inspect
+import re
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Literal
+
+import pytest
+
+from logging_decorator import LogConfig
+from logging_decorator.logging_decorator import pretty_repr as pretty_repr_module
+from logging_decorator.logging_decorator.pretty_repr import pretty_repr
+
+_COMPLEX = LogConfig(show_complex_args=True, max_depth=10)
+
+
+@dataclass
+class Node:
+    """Узел графа с обратными ссылками."""
+
+    name: str
+    parent: Node | None = None
+    children: list[Node] = field(default_factory=list)
+
+
+def test_cycle_in_container() -> None:
+    """Тест циклической ссылки в списке."""
+    items: list[object] = [1]
+    items.append(items)
+    assert re.fullmatch(
+        r'list\(1, <cycle list@0x[0-9a-f]+>\)',
+        pretty_repr(items, _COMPLEX),
+    )
+
+
+def test_cycle_in_objects() -> None:
+    """Тест обратной ссылки потомка на родителя."""
+    root = Node('root')
+    root.children.append(Node('child', parent=root))
+    result = pretty_repr(root, _COMPLEX)
+    assert re.search(r"parent\\': \\'<cycle Node@0x[0-9a-f]+>", result)
+    assert 'child' in result
+
+
+def test_shared_subobject_rendered_once() -> None:
+    """Тест вывода повторно встреченного объекта ссылкой."""
+    shared = Node('shared')
+    result = pretty_repr([shared, shared], _COMPLEX)
+    assert result.count("'shared'") == 1
+    assert re.search(r'<ref Node@0x[0-9a-f]+>\)$', result)
+
+
+def test_tuples_not_deduplicated() -> None:
+    """Тест повторных кортежей: выводятся полностью, без адресов."""
+    shared = (1, 2)
+    assert pretty_repr(((1, 2), (1, 2)), _COMPLEX) == 'tuple(tuple(1, 2), tuple(1, 2))'
+    assert pretty_repr([shared, {'a': shared}], _COMPLEX) == (
+        'list(tuple(1, 2), dict(a: tuple(1, 2)))'
+    )
+    items: list[object] = []
+    looped = (items,)
+    items.append(looped)
+    assert re.fullmatch(
+        r'tuple\(list\(<cycle tuple@0x[0-9a-f]+>\)\)',
+        pretty_repr(looped, _COMPLEX),
+    )
+
+
+def test_scalars_not_deduplicated() -> None:
+    """Тест того, что одинаковые скаляры и пустые контейнеры выводятся как есть."""
+    assert pretty_repr([1, 1, (), ()], LogConfig()) == 'list(1, 1, tuple(), tuple())'
+
+
+def test_deep_nesting_without_recursion_error() -> None:
+    """Тест глубокой вложенности больше лимита рекурсии."""
+    nested: list[object] = []
+    for _ in range(5000):
+        nested = [nested]
+    result = pretty_repr(nested, LogConfig(max_depth=2))
+    assert result.startswith('list(list(list(')
+
+
+def test_dag_linear_time() -> None:
+    """Тест обхода графа с общими узлами за линейное время."""
+    layer = [Node(str(i)) for i in range(5)]
+    for level in range(30):
+        layer = [Node(f'{level}-{i}', children=list(layer)) for i in range(5)]
+    start = time.perf_counter()
+    result = pretty_repr(layer, LogConfig(show_complex_args=True, max_depth=40))
+    assert time.perf_counter() - start < 1
+    assert '<ref Node@' in result
+
+
+def _callback(a: dict[str, list[int]], b: int | None = None) -> Callable[[str], None]: ...
+
+
+class _Service:
+    def handle(self, item: Literal['a', 'b'], *args: int, **kwargs: str) -> None: ...
+
+
+@pytest.mark.parametrize(
+    ('func', 'expected'),
+    [
+        (
+            _callback,
+            '_callback(a: dict[str, list[int]], b: int | None = None) '
+            '-> Callable[[str], None]',
+        ),
+        (
+            _Service().handle,
+            "handle(item: Literal['a', 'b'], *args: int, **kwargs: str) -> None",
+        ),
+        (
+            partial(_callback, {}),
+            'partial(_callback)(b: int | None = None) -> Callable[[str], None]',
+        ),
+        (lambda x: x, '<lambda>(x)'),
+        (lambda *args, **kwargs: (args, kwargs), '<lambda>(*args, **kwargs)'),
+    ],
+)
+def test_callable_repr(func: Callable[..., Any], expected: str) -> None:
+    """Тест представления функций, методов, partial и lambda."""
+    assert pretty_repr(func, LogConfig()) == expected
+
+
+def _send(msg: str, *, api_token: str = 'default', retries: int = 3) -> None: ...
+
+
+def test_callable_defaults_redacted() -> None:
+    """Тест скрытия значений partial и умолчаний по правилам `skipped_args`."""
+    assert pretty_repr(partial(_send, api_token='SECRET'), LogConfig()) == (
+        'partial(_send)(msg: str, api_token: str, retries: int = 3) -> None'
+    )
+    assert pretty_repr(_send, LogConfig(skipped_args=['*token*'])) == (
+        '_send(msg: str, api_token: str = <redacted>, retries: int = 3) -> None'
+    )
+
+
+def test_callable_without_signature() -> None:
+    """Тест вызываемого объекта без сигнатуры: обычные правила глубины и вывода."""
+    func = partial(max, key=len)
+    assert pretty_repr(func, LogConfig()) == '<partial>'
+    assert pretty_repr([[func]], LogConfig(show_complex_args=True)) == 'list(list(...))'
+
+
+def test_callable_repr_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Тест однократного вычисления сигнатуры для функции и метода."""
+    calls = []
+    signature = inspect.signature
+
+    def _counting_signature(obj: Callable[..., Any]) -> inspect.Signature:
+        calls.append(obj)
+        return signature(obj)
+
+    monkeypatch.setattr(inspect, 'signature', _counting_signature)
+
+    def callback(a: int = 1) -> None: ...
+
+    class Service:
+        def handle(self) -> None: ...
+
+    service = Service()
+    for _ in range(3):
+        assert pretty_repr(callback, LogConfig()) == 'callback(a: int = 1) -> None'
+        assert pretty_repr(service.handle, LogConfig()) == 'handle() -> None'
+    assert len(calls) == 2
+
+    calls.clear()
+    callback_ref = weakref.ref(callback)
+    callback_id = id(callback)
+    tables = pretty_repr_module._thread_templates.tables  # noqa: SLF001
+    assert callback_id in tables.functions
+    del callback
+    gc.collect()
+    assert callback_ref() is None
+    assert callback_id not in tables.functions
+
+
+def test_register_after_render() -> None:
+    """Тест сброса кэша диспетчеризации при регистрации и в другом потоке."""
+
+    class Money(float): ...
+
+    value = [Money(1.5)]
+    assert pretty_repr(value, LogConfig()) == 'list(1.5)'
+
+    @pretty_repr.register(Money)
+    def _(obj: Money, config: LogConfig, depth: int = 0) -> str:  # noqa: ARG001
+        return f'{float(obj):.2f} руб.'
+
+    assert pretty_repr(value, LogConfig()) == 'list(1.50 руб.)'
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.append(pretty_repr(value, LogConfig())),
+    )
+    thread.start()
+    thread.join()
+    assert results == ['list(1.50 руб.)']
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import pytest
+
+from logging_decorator import LogConfig
+from logging_decorator.logging_decorator.pretty_repr import pretty_repr
+from logging_decorator.logging_decorator.redaction import REDACT, Redactor
+from logging_decorator.logging_decorator.services import get_signature_repr
+
+
+@dataclass
+class Request:
+    """Запрос с заголовками."""
+
+    url: str
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def _handler(request: Request, payload: dict, password: str) -> None: ...
+
+
+_REQUEST = Request('/api', {'authorization': 'Bearer x', 'accept': 'json'})
+
+
+@pytest.mark.parametrize(
+    ('skipped_args', 'expected'),
+    [
+        (
+            ('password', 'request.headers.authorization'),
+            "request: Request = Request({'headers': \"dict(authorization: <redacted>, "
+            "accept: 'json')\", 'url': \"'/api'\"})\n"
+            "  payload: dict = dict(items: list(dict(api_token: 'secret')))",
+        ),
+        (
+            ('*token*', 'password', 'request.*.accept'),
+            "request: Request = Request({'headers': \"dict(authorization: "
+            "'Bearer x', accept: <redacted>)\", 'url': \"'/api'\"})\n"
+            '  payload: dict = dict(items: list(dict(api_token: <redacted>)))',
+        ),
+        (
+            ('payload.items.api_token', 'request', 'password'),
+            'payload: dict = dict(items: list(dict(api_token: <redacted>)))',
+        ),
+    ],
+)
+def test_nested_redaction(skipped_args: tuple[str, ...], expected: str) -> None:
+    """Тест скрытия вложенных значений по путям и шаблонам."""
+    config = LogConfig(skipped_args=skipped_args, show_complex_args=True, max_depth=5)
+    signature = get_signature_repr(
+        _handler,
+        (_REQUEST, {'items': [{'api_token': 'secret'}]}, 'qwerty'),
+        {},
+        config,
+    )
+    assert signature == expected
+
+
+def test_glob_applies_without_name() -> None:
+    """Тест применения шаблона при форматировании без имени аргумента."""
+    config = LogConfig(skipped_args=['*secret'])
+    assert (
+        pretty_repr({'my_secret': 1, 'b': 2}, config)
+        == 'dict(my_secret: <redacted>, b: 2)'
+    )
+
+
+def test_redaction_ignores_case() -> None:
+    """Тест скрытия без учета регистра: шаблоны, пути и имена аргументов."""
+    config = LogConfig(
+        skipped_args=['*token*', 'request.headers.authorization', 'Password'],
+        show_complex_args=True,
+    )
+    headers = {'Token': 1, 'X-Auth-Token': 2, 'API_TOKEN': 3, 'Accept': 'json'}
+    assert pretty_repr(headers, config) == (
+        'dict(Token: <redacted>, X-Auth-Token: <redacted>, API_TOKEN: <redacted>, '
+        "Accept: 'json')"
+    )
+    request = Request('/api', {'Authorization': 'Bearer x'})
+    signature = get_signature_repr(_handler, (request, {}, 'qwerty'), {}, config)
+    assert 'Bearer' not in signature
+    assert 'Authorization: <redacted>' in signature
+    assert 'qwerty' not in signature
+
+
+def test_redactor_compilation() -> None:
+    """Тест компиляции правил в дерево и шаблоны."""
+    redactor = Redactor(['a', 'b.c.d', 'b.c', '*key'])
+    assert redactor.root('a') is REDACT
+    assert redactor.root('api_key') is REDACT
+    assert redactor.root('b') is not REDACT
+    assert redactor.child(redactor.root('b'), 'c') is REDACT
+    assert not Redactor([]).active
+
+
+def test_config_compiled_once() -> None:
+    """Тест нормализации skipped_args и пересборки при from_config."""
+    config = LogConfig(skipped_args=['a', 'a'])
+    assert config.skipped_args == frozenset({'a'})
+    assert hash(config) == hash(LogConfig(skipped_args=('a',)))
+    derived = LogConfig.from_config(config, skipped_args=['b'])
+    assert derived.redactor.root('b') is REDACT
+    assert derived.redactor.root('a') is None
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING, Iterator
+
+import pytest
+
+from logging_decorator import LogConfig, log, log_class, registry
+
+if TYPE_CHECKING:
+    from tests.conftest import MockLogger
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry() -> Iterator[None]:
+    yield
+    registry.reset()
+
+
+def test_disable_and_enable_by_name(logger: MockLogger) -> None:
+    """Тест выключения логирования конкретной функции."""
+
+    @log(logger)
+    def target() -> int:
+        return 1
+
+    @log(logger)
+    def other() -> int:
+        return 2
+
+    assert registry.disable('*test_disable_and_enable_by_name.<locals>.target') == 1
+    assert target() == 1
+    other()
+    assert [m['extra']['func'] for m in logger.messages] == ['other', 'other']
+
+    registry.enable('*_by_name.<locals>.target')
+    target()
+    assert logger.messages[-1]['extra']['func'] == 'target'
+
+
+def test_hot_reconfiguration(logger: MockLogger) -> None:
+    """Тест изменения конфигурации без переоборачивания."""
+
+    @log(logger, LogConfig(include_args=True))
+    def target(secret: str) -> str:
+        return secret
+
+    target('value')
+    assert "secret: str = 'value'" in logger.messages[0]['msg']
+
+    name = f'{__name__}.test_hot_reconfiguration.<locals>.target'
+    version = registry.get(name)[name].version
+    registry.configure(f'{__name__}.*', include_args=False)
+    snapshot = registry.get(name)[name]
+    assert snapshot.version > version
+    assert not snapshot.config.include_args
+
+    logger.messages.clear()
+    target('value')
+    assert 'value' not in logger.messages[0]['msg']
+
+
+def test_rule_applies_to_later_decorated(logger: MockLogger) -> None:
+    """Тест применения глобального правила к функциям, задекорированным позже."""
+    registry.configure(max_depth=3)
+
+    @log(logger)
+    def target() -> None: ...
+
+    name = f'{__name__}.test_rule_applies_to_later_decorated.<locals>.target'
+    assert registry.get(name)[name].config.max_depth == 3
+    registry.reset()
+    assert registry.get(name)[name].config.max_depth == 1
+
+
+def test_group_switch_and_registry(logger: MockLogger) -> None:
+    """Тест совместной работы переключателя группы и реестра."""
+
+    @log_class(logger)
+    class Service:
+        def method(self) -> int:  # noqa: PLR6301
+            return 1
+
+    Service.__instrumentation__.disable()  # type: ignore
+    registry.enable()
+    Service().method()
+    assert not logger.messages
+
+    Service.__instrumentation__.enable()  # type: ignore
+    Service().method()
+    assert len(logger.messages) == 2
+
+
+def test_repeated_rules_do_not_accumulate(logger: MockLogger) -> None:
+    """Тест замены правил того же шаблона с сохранением порядка применения."""
+
+    @log(logger)
+    def target() -> int:
+        return 1
+
+    name = '*test_repeated_rules_do_not_accumulate.<locals>.target'
+    registry.configure(name, max_depth=3)
+    registry.configure('*', max_depth=5)
+    for _ in range(100):
+        registry.disable(name)
+        registry.enable(name)
+
+    assert len(registry._rules) == 3  # noqa: SLF001
+    (snapshot,) = registry.get(name).values()
+    assert snapshot.enabled
+    assert snapshot.config.max_depth == 5
+
+
+def test_partial_and_callable_instance(logger: MockLogger) -> None:
+    """Тест регистрации partial и вызываемого экземпляра."""
+
+    class Handler:
+        def __call__(self, a: int) -> int:
+            return a
+
+    maximum = log(logger)(partial(max, 1))
+    handler = log(logger)(Handler())
+    assert maximum(2) == 2
+    assert handler(3) == 3
+    assert [m['extra']['func'] for m in logger.messages] == [
+        'partial',
+        'partial',
+        'Handler',
+        'Handler',
+    ]
+    assert registry.get('functools.partial')
+    assert registry.get('*.Handler')
+
+
+def test_configure_unknown_field() -> None:
+    """Тест ошибки при неизвестном поле конфигурации."""
+    with pytest.raises(TypeError):
+        registry.configure(unknown_field=True)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import re
+import tracemalloc
+from typing import TYPE_CHECKING
+
+import pytest
+
+from logging_decorator import LogConfig, log
+
+if TYPE_CHECKING:
+    from tests.conftest import MockLogger
+
+
+def test_resources_disabled_by_default(logger: MockLogger) -> None:
+    """Тест отсутствия метрик без явного включения."""
+
+    @log(logger)
+    def target() -> None: ...
+
+    target()
+    assert 'resources' not in logger.messages[-1]['extra']
+
+
+def test_sync_resources(logger: MockLogger) -> None:
+    """Тест замера CPU, памяти и сборок мусора."""
+    config = LogConfig(measure_cpu_time=True, measure_memory=True, measure_gc=True)
+
+    @log(logger, config)
+    def target() -> list[bytes]:
+        gc.collect()
+        return [bytes(1000) for _ in range(100)]
+
+    tracemalloc.start()
+    try:
+        result = target()
+    finally:
+        tracemalloc.stop()
+
+    resources = logger.messages[-1]['extra']['resources']
+    assert set(resources) == {'cpu_time', 'memory_delta', 'memory_peak', 'gc_collections'}
+    assert resources['cpu_time'] >= 0
+    assert resources['memory_delta'] >= len(result) * 1000
+    assert resources['memory_peak'] >= resources['memory_delta']
+    assert resources['gc_collections'] >= 1
+    assert 'сборок мусора' in logger.messages[-1]['msg']
+    assert re.search(r' сек\. \(CPU .+\)$', logger.messages[-1]['msg'])
+
+
+def test_nested_memory_peak(logger: MockLogger) -> None:
+    """Тест пика памяти: вложенный замер не сбрасывает пик внешнего."""
+    config = LogConfig(measure_memory=True)
+
+    @log(logger, config)
+    def inner() -> None:
+        msg = 'Тестовая ошибка'
+        raise ValueError(msg)
+
+    @log(logger, config)
+    def outer() -> None:
+        data = bytes(10_000_000)
+        del data
+        with pytest.raises(ValueError, match='Тестовая ошибка'):
+            inner()
+        inner_ok()
+
+    @log(logger, config)
+    def inner_ok() -> None: ...
+
+    tracemalloc.start()
+    try:
+        outer()
+        outer()
+    finally:
+        tracemalloc.stop()
+
+    resources = [
+        m['extra']['resources'] for m in logger.messages if 'resources' in m['extra']
+    ]
+    assert [set(r) for r in resources] == [
+        {'memory_delta'},
+        {'memory_delta', 'memory_peak'},
+    ] * 2
+    assert resources[-1]['memory_peak'] >= 10_000_000
+
+
+def test_memory_skipped_without_tracemalloc(logger: MockLogger) -> None:
+    """Тест пропуска памяти, если tracemalloc не запущен."""
+
+    @log(logger, LogConfig(measure_memory=True))
+    def target() -> None: ...
+
+    target()
+    assert logger.messages[-1]['extra']['resources'] == {}
+    assert logger.messages[-1]['msg'].endswith(' сек.')
+
+
+def test_async_resources(logger: MockLogger) -> None:
+    """Тест замера приостановок и времени ожидания асинхронной функции."""
+
+    @log(logger, LogConfig(measure_cpu_time=True, measure_await=True))
+    async def target() -> int:
+        for _ in range(3):
+            await asyncio.sleep(0.01)
+        return 1
+
+    assert asyncio.run(target()) == 1
+    resources = logger.messages[-1]['extra']['resources']
+    assert resources['suspensions'] == 3
+    assert resources['awaiting_time'] >= 0.02
+    assert resources['running_time'] < resources['awaiting_time']
+    assert resources['cpu_time'] >= 0
+
+
+def test_async_resources_exception(logger: MockLogger) -> None:
+    """Тест проброса исключения через замер по шагам."""
+
+    @log(logger, LogConfig(measure_await=True))
+    async def target() -> None:
+        await asyncio.sleep(0)
+        msg = 'Тестовая ошибка'
+        raise ValueError(msg)
+
+    with pytest.raises(ValueError, match='Тестовая ошибка'):
+        asyncio.run(target())
+    assert logger.messages[-1]['level'] == 'ERROR'